@@ -4,21 +4,24 @@ Mantiene Flask-SQLAlchemy pero no inicia routes ni SocketIO.
 """
 from flask import Flask
 from config import Config
-from models import db
+from models import db, VisitaEmergencia, register_unicode_lower
 from auth import init_default_users
 import logging
 import os
 
-def create_app():
+def create_app(config_class=Config):
     """
     Crea aplicación Flask para uso en consola (sin servidor web).
 
+    Args:
+        config_class: clase de configuración (la TUI pasa TUIConfig)
+
     Returns:
         Flask: Aplicación Flask configurada con SQLAlchemy
     """
     # Crear app sin templates ni static (no son necesarios para consola)
     app = Flask(__name__)
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     # Inicializar SQLAlchemy (mantener setup existente sin cambios)
     db.init_app(app)
@@ -35,7 +38,12 @@ def create_app():
 
     # Crear tablas y usuarios por defecto
     with app.app_context():
+        # Búsqueda de visitas sin distinguir mayúsculas acentuadas (SQLite)
+        register_unicode_lower(db.engine)
         db.create_all()
+        # create_all no agrega índices a tablas que ya existían
+        for index in VisitaEmergencia.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
         init_default_users()  # Función existente de auth.py
 
     return app
@@ -1,6 +1,10 @@
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
 from flask import redirect, url_for, flash, session
 from flask_login import LoginManager, current_user
+from sqlalchemy import event
 from models import Usuario, db
 
 login_manager = LoginManager()
@@ -141,3 +145,47 @@ def can_access_sala(user, id_sala):
         return user_info['sala_id'] == id_sala
 
     return False
+
+
+# ============================================================================
+# CACHÉ NEGATIVO DE USUARIOS - usernames que no existen
+# ============================================================================
+
+# username -> cached_at. Los intentos repetidos de login con un usuario
+# inexistente no tocan la BD. Vive aquí (y no en la pantalla de login) para
+# que el listener de Usuario quede registrado en todo proceso que importe auth
+_NEG_CACHE_TTL = 30.0  # segundos
+_NEG_CACHE_MAX = 256
+_NEG_CACHE: "OrderedDict[str, float]" = OrderedDict()
+_NEG_CACHE_LOCK = threading.Lock()
+
+
+def is_username_known_missing(username):
+    """True si el username se buscó hace poco y no existía"""
+    now = time.monotonic()
+    with _NEG_CACHE_LOCK:
+        # Las entradas van en orden de inserción: las vencidas están al frente
+        while _NEG_CACHE and now - next(iter(_NEG_CACHE.values())) >= _NEG_CACHE_TTL:
+            _NEG_CACHE.popitem(last=False)
+        return username in _NEG_CACHE
+
+
+def remember_missing_username(username):
+    """Registra un username que no existe"""
+    with _NEG_CACHE_LOCK:
+        _NEG_CACHE.pop(username, None)
+        _NEG_CACHE[username] = time.monotonic()
+        if len(_NEG_CACHE) > _NEG_CACHE_MAX:
+            _NEG_CACHE.popitem(last=False)
+
+
+def forget_missing_username(username):
+    """Quita el username del caché negativo (al crear el usuario)"""
+    with _NEG_CACHE_LOCK:
+        _NEG_CACHE.pop(username, None)
+
+
+@event.listens_for(Usuario, 'after_insert')
+def _on_usuario_created(mapper, connection, target):
+    """Un usuario recién creado debe poder iniciar sesión de inmediato"""
+    forget_missing_username(target.username)
@@ -4,7 +4,7 @@ import time
 import threading
 import logging
 from enum import Enum
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from .communication import CommunicationManager, Message
 from .discovery import NodeDiscovery
 
@@ -77,6 +77,13 @@ class BullyNode:
         self.node_last_seen: Dict[int, float] = {}
         self.grace_period = 30  # Segundos antes de aceptar líder de menor prioridad
 
+        # Versión de membresía: se incrementa (bajo self.lock) cada vez que
+        # cambian cluster_nodes o node_last_seen. snapshot() la compara para
+        # reutilizar sus copias mientras no haya cambios.
+        self.membership_version = 0
+        # (versión, copia de cluster_nodes, copia de node_last_seen)
+        self._membership_copy: Tuple[int, Dict, Dict] = (-1, {}, {})
+
         # Inicializar tracking para nodos conocidos
         for nid in self.cluster_nodes.keys():
             if nid != node_id:
@@ -99,6 +106,9 @@ class BullyNode:
         # Lock para operaciones críticas
         self.lock = threading.Lock()
 
+        # Observadores notificados cuando cambia membresía/líder/term/estado
+        self._state_listeners: List[Callable[[], None]] = []
+
         logger.info(f"[Node-{node_id}] [BULLY] Node initialized (TCP:{tcp_port}, UDP:{udp_port})")
     
     def start(self):
@@ -223,6 +233,8 @@ class BullyNode:
             self.current_term += 1
             current_term = self.current_term
 
+        self._notify_state_change()
+
         logger.info(f"[Node-{self.node_id}] [ELECTION] Starting ELECTION process (term {current_term})")
 
         # Encontrar nodos con ID mayor
@@ -270,6 +282,7 @@ class BullyNode:
                     logger.info(f"[Node-{self.node_id}] [ELECTION] COORDINATOR received from node {self.current_leader}")
                     with self.lock:
                         self.election_in_progress = False
+                    self._notify_state_change()
                     return
                 time.sleep(0.5)
 
@@ -284,6 +297,7 @@ class BullyNode:
             self._become_leader()
             with self.lock:
                 self.election_in_progress = False
+            self._notify_state_change()
     
     def _become_leader(self):
         """Se convierte en líder y anuncia a todos"""
@@ -331,6 +345,8 @@ class BullyNode:
         with self.lock:
             self.election_in_progress = False
             logger.debug(f"[Node-{self.node_id}] [LEADER] Election flag cleared after becoming leader")
+
+        self._notify_state_change()
     
     # ========================================================================
     # HANDLERS DE MENSAJES
@@ -398,6 +414,7 @@ class BullyNode:
             self.last_heartbeat_received = time.time()
 
         logger.info(f"[Node-{self.node_id}] [COORDINATOR] Node {new_leader} is now the leader")
+        self._notify_state_change()
         return None
     
     def _handle_heartbeat(self, message: Message):
@@ -436,12 +453,14 @@ class BullyNode:
                     logger.info(f"[Node-{self.node_id}] [HEARTBEAT] ✓ Leader is node {leader_id} (discovered via heartbeat)")
                 else:
                     logger.info(f"[Node-{self.node_id}] [HEARTBEAT] ✓ Leader changed from node {old_leader} to node {leader_id}")
+            self._notify_state_change()
         else:
             # Ensure we're FOLLOWER even when confirming same leader
             if self.state == NodeState.LEADER:
                 with self.lock:
                     self.state = NodeState.FOLLOWER
                     logger.warning(f"[Node-{self.node_id}] [HEARTBEAT] 👑➡️💼 ABDICATION: I was LEADER but accepting higher-priority leader {leader_id}")
+                self._notify_state_change()
             else:
                 logger.info(f"[Node-{self.node_id}] [HEARTBEAT] ✓ Confirmed leader {leader_id}")
     
@@ -563,9 +582,13 @@ class BullyNode:
 
     def _update_node_activity(self, node_id: int):
         """Actualiza el timestamp de última actividad de un nodo"""
-        if node_id != self.node_id and node_id in self.node_last_seen:
+        with self.lock:
+            if node_id == self.node_id or node_id not in self.node_last_seen:
+                return
             self.node_last_seen[node_id] = time.time()
-            logger.debug(f"[Node-{self.node_id}] [TRACKING] Updated activity for node {node_id}")
+            self.membership_version += 1
+        logger.debug(f"[Node-{self.node_id}] [TRACKING] Updated activity for node {node_id}")
+        self._notify_state_change()
 
     # ========================================================================
     # GESTIÓN DINÁMICA DE NODOS
@@ -614,13 +637,19 @@ class BullyNode:
             tcp_port: Puerto TCP del nodo
             udp_port: Puerto UDP del nodo
         """
+        added = False
         with self.lock:
             if node_id != self.node_id and node_id not in self.cluster_nodes:
                 self.cluster_nodes[node_id] = (host, tcp_port, udp_port)
                 self.node_last_seen[node_id] = time.time()
+                self.membership_version += 1
+                added = True
                 logger.info(f"[Node-{self.node_id}] [DYNAMIC] ✓ Added node {node_id} ({host}:{tcp_port}) to cluster")
                 logger.info(f"[Node-{self.node_id}] [DYNAMIC] Cluster now has {len(self.cluster_nodes)} nodes")
 
+        if added:
+            self._notify_state_change()
+
     def remove_node(self, node_id: int):
         """
         Remueve un nodo del cluster dinámicamente.
@@ -628,14 +657,49 @@ class BullyNode:
         Args:
             node_id: ID del nodo a remover
         """
+        removed = False
         with self.lock:
             if node_id in self.cluster_nodes:
                 node_info = self.cluster_nodes.pop(node_id)
                 if node_id in self.node_last_seen:
                     del self.node_last_seen[node_id]
+                self.membership_version += 1
+                removed = True
                 logger.warning(f"[Node-{self.node_id}] [DYNAMIC] ✗ Removed node {node_id} ({node_info[0]}) from cluster")
                 logger.info(f"[Node-{self.node_id}] [DYNAMIC] Cluster now has {len(self.cluster_nodes)} nodes")
 
+        if removed:
+            self._notify_state_change()
+
+    # ========================================================================
+    # OBSERVADORES DE ESTADO
+    # ========================================================================
+
+    def add_state_listener(self, callback: Callable[[], None]):
+        """
+        Registra un callback que se invoca cuando cambian la membresía,
+        el líder, el term o el estado de elección.
+
+        El callback se ejecuta en el thread que produjo el cambio (threads de
+        red/heartbeat), fuera del lock; debe ser rápido y thread-safe.
+        """
+        self._state_listeners.append(callback)
+
+    def remove_state_listener(self, callback: Callable[[], None]):
+        """Elimina un callback registrado con add_state_listener"""
+        try:
+            self._state_listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify_state_change(self):
+        """Invoca a todos los observadores registrados"""
+        for callback in list(self._state_listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"[Node-{self.node_id}] [LISTENER] State listener failed: {e}")
+
     # ========================================================================
     # API PÚBLICA
     # ========================================================================
@@ -661,3 +725,34 @@ class BullyNode:
             'is_leader': self.is_leader(),
             'time_since_last_heartbeat': time.time() - self.last_heartbeat_received
         }
+
+    def snapshot(self) -> dict:
+        """
+        Retorna una vista consistente del estado del nodo tomada bajo un solo lock.
+
+        Evita lecturas "rotas" (p.ej. current_leader y state en desacuerdo durante
+        una elección). cluster_nodes y node_last_seen se copian dentro del lock,
+        porque los hilos de descubrimiento los modifican mientras la UI los
+        recorre; mientras membership_version no cambie se reutiliza la misma
+        copia, así que quien la reciba no debe modificarla.
+        """
+        with self.lock:
+            if self._membership_copy[0] != self.membership_version:
+                self._membership_copy = (
+                    self.membership_version,
+                    dict(self.cluster_nodes),
+                    dict(self.node_last_seen),
+                )
+            _, cluster_nodes, node_last_seen = self._membership_copy
+            return {
+                'node_id': self.node_id,
+                'current_leader': self.current_leader,
+                'state': self.state.value,
+                'cluster_nodes': cluster_nodes,
+                'node_last_seen': node_last_seen,
+                'election_in_progress': self.election_in_progress,
+                'current_term': self.current_term,
+                'use_discovery': self.use_discovery,
+                'tcp_port': self.tcp_port,
+                'udp_port': self.udp_port,
+            }
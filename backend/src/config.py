@@ -1,4 +1,6 @@
 import os
+import functools
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -134,6 +136,27 @@ class Config:
         """Retorna True si el cluster usa auto-descubrimiento dinámico."""
         return cls.CLUSTER_MODE == 'dynamic'
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def build_static_cluster(cls, node_id):
+        """
+        Construye el mapa de nodos del cluster para modo estático.
+
+        El resultado se cachea por node_id y es de solo lectura, de modo que
+        todos los BullyNode del mismo proceso comparten el mismo mapa.
+
+        Args:
+            node_id: ID del nodo local (se excluye del mapa)
+
+        Returns:
+            Mapping {node_id: (host, tcp_port, udp_port)} como espera BullyNode
+        """
+        return MappingProxyType({
+            nodo['id']: ('localhost', nodo['tcp_port'], 6000 + nodo['id'] - 1)
+            for nodo in cls.OTROS_NODOS
+            if nodo['id'] != node_id
+        })
+
     @classmethod
     def get_otros_nodos_activos(cls):
         """
@@ -167,3 +190,18 @@ class Config:
             if nodo['id'] == cls.NODE_ID:
                 return nodo
         return None
+
+
+class TUIConfig(Config):
+    """
+    Configuración de la TUI (main_textual.py). El resto de los procesos usa
+    Config y conserva los valores por defecto del pool de SQLAlchemy.
+    """
+    # Hilos del executor de BD de la TUI (textual_app.utils.db_executor).
+    # El pool del engine reserva una conexión por hilo; el overflow queda
+    # para los demás usuarios de la BD (monitor de notificaciones).
+    DB_WORKERS = int(os.getenv('DB_WORKERS', '4'))
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': DB_WORKERS,
+        'max_overflow': int(os.getenv('DB_POOL_OVERFLOW', '5')),
+    }
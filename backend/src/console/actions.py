@@ -251,8 +251,7 @@ def create_visit(app, bully_manager, user):
                     id_trabajador=trabajador.id_trabajador,
                     id_sala=app.config['NODE_ID'],
                     sintomas=sintomas,
-                    estado='activa',
-                    timestamp=datetime.utcnow()
+                    estado='activa'
                 )
 
                 db.session.add(visita)
@@ -41,8 +41,10 @@ def setup_logging(node_id):
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
+    # node_id is fixed for the process, so it goes straight into the format
+    # string instead of being injected per record by a filter
     log_format = logging.Formatter(
-        fmt='[%(asctime)s] [Node-%(node_id)s] [%(levelname)s] [%(name)s] %(message)s',
+        fmt=f'[%(asctime)s] [Node-{node_id}] [%(levelname)s] [%(name)s] %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
@@ -59,13 +61,6 @@ def setup_logging(node_id):
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(log_format)
 
-    # Add node_id filter
-    class NodeIdFilter(logging.Filter):
-        def filter(self, record):
-            record.node_id = node_id
-            return True
-
-    file_handler.addFilter(NodeIdFilter())
     root_logger.addHandler(file_handler)
 
     # Silence noisy libraries
@@ -150,15 +145,8 @@ def main():
             console.print(f"[yellow]Modo estático:[/yellow] Usando lista fija de nodos")
             logger.info("Using STATIC mode - fixed cluster_nodes")
 
-            cluster_nodes = {}
-            for nodo_info in Config.OTROS_NODOS:
-                if nodo_info['id'] != node_id:
-                    # BullyNode expects tuple: (host, tcp_port, udp_port)
-                    cluster_nodes[nodo_info['id']] = (
-                        'localhost',  # host
-                        nodo_info['tcp_port'],  # tcp_port
-                        6000 + nodo_info['id'] - 1  # udp_port
-                    )
+            # BullyNode expects tuples: (host, tcp_port, udp_port)
+            cluster_nodes = Config.build_static_cluster(node_id)
 
             bully_manager = BullyNode(
                 node_id=node_id,
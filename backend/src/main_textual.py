@@ -52,9 +52,10 @@ def setup_environment():
 def create_flask_app():
     """Create Flask app context for database access"""
     from app_factory import create_app
+    from config import TUIConfig
     
     logger.info("Creating Flask app context...")
-    app = create_app()
+    app = create_app(TUIConfig)
     
     # Initialize database
     with app.app_context():
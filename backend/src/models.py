@@ -106,9 +106,18 @@ class VisitaEmergencia(db.Model):
     sintomas = db.Column(db.Text)
     diagnostico = db.Column(db.Text)
     estado = db.Column(db.String(20), default='activa')  # 'activa', 'completada', 'cancelada'
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    # Hora de alta en UTC. create_all no altera tablas existentes y las BD de
+    # nodo anteriores no tienen DEFAULT en la columna, así que el ORM y los
+    # insert() de Core siguen mandándola; server_default cubre las BD nuevas
+    # y los INSERT en SQL plano
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now())
     fecha_cierre = db.Column(db.DateTime)
 
+    # El listado de visitas filtra por estado y ordena por fecha descendente
+    __table_args__ = (
+        db.Index('ix_visitas_estado_ts', estado, timestamp.desc()),
+    )
+
     def __repr__(self):
         return f'<VisitaEmergencia {self.folio} - {self.estado}>'
 
@@ -221,6 +230,110 @@ def get_camas_disponibles(id_sala=None):
     return query.all()
 
 
+def get_doctores_y_camas(id_sala=None):
+    """
+    Obtiene doctores y camas disponibles en una sola consulta (UNION ALL).
+
+    Args:
+        id_sala: (opcional) ID de la sala para filtrar
+
+    Returns:
+        tuple: (doctores, camas) como listas de (id, etiqueta)
+    """
+    from sqlalchemy import String, cast, func, literal, select, union_all
+
+    doctores_q = select(
+        literal('d').label('kind'),
+        Doctor.id_doctor.label('id'),
+        (Doctor.nombre + ' - ' + func.coalesce(Doctor.especialidad, '')).label('label')
+    ).where(Doctor.disponible == True, Doctor.activo == True)
+
+    camas_q = select(
+        literal('c'),
+        Cama.id_cama,
+        'Cama ' + cast(Cama.numero, String) + ' - Sala ' + cast(Cama.id_sala, String)
+    ).where(Cama.ocupada == False)
+
+    if id_sala:
+        doctores_q = doctores_q.where(Doctor.id_sala == id_sala)
+        camas_q = camas_q.where(Cama.id_sala == id_sala)
+
+    doctores, camas = [], []
+    for kind, id_, label in db.session.execute(union_all(doctores_q, camas_q)):
+        (doctores if kind == 'd' else camas).append((id_, label))
+
+    return doctores, camas
+
+
+def get_primer_doctor_y_cama(id_sala=None, for_update=False):
+    """
+    Obtiene el primer doctor y la primera cama disponibles en una sola
+    consulta (UNION ALL de dos subconsultas LIMIT 1).
+
+    Args:
+        id_sala: (opcional) ID de la sala para filtrar
+        for_update: bloquear las filas elegidas (SELECT ... FOR UPDATE SKIP
+            LOCKED) para que transacciones concurrentes tomen otras. Como
+            FOR UPDATE no se permite con UNION, en motores que lo soportan
+            se hace una consulta por recurso. En SQLite no reserva nada: no
+            hay bloqueo por fila y pysqlite no abre la transacción antes de
+            un SELECT, así que dos llamadas concurrentes pueden recibir el
+            mismo doctor y cama. Quien los ocupe debe hacerlo con un UPDATE
+            condicional (WHERE disponible / WHERE NOT ocupada) y revisar el
+            rowcount.
+
+    Returns:
+        tuple: (doctor, cama) donde doctor es (id_doctor, nombre) y cama es
+        (id_cama, numero); cualquiera puede ser None si no hay disponibles
+    """
+    from sqlalchemy import Integer, String, cast, literal, null, select, union_all
+
+    doctor_q = select(
+        literal('d').label('kind'),
+        Doctor.id_doctor.label('id'),
+        Doctor.nombre.label('nombre'),
+        cast(null(), Integer).label('numero')
+    ).where(Doctor.disponible == True, Doctor.activo == True)
+
+    cama_q = select(
+        literal('c'),
+        Cama.id_cama,
+        cast(null(), String),
+        Cama.numero
+    ).where(Cama.ocupada == False)
+
+    if id_sala:
+        doctor_q = doctor_q.where(Doctor.id_sala == id_sala)
+        cama_q = cama_q.where(Cama.id_sala == id_sala)
+
+    doctor_q = doctor_q.order_by(Doctor.id_doctor).limit(1)
+    cama_q = cama_q.order_by(Cama.id_cama).limit(1)
+
+    if for_update and db.session.get_bind().dialect.name != 'sqlite':
+        doctor = db.session.execute(doctor_q.with_for_update(skip_locked=True)).first()
+        cama = db.session.execute(cama_q.with_for_update(skip_locked=True)).first()
+        return (
+            (doctor.id, doctor.nombre) if doctor else None,
+            (cama.id_cama, cama.numero) if cama else None,
+        )
+
+    # LIMIT dentro de cada rama requiere subconsulta (SQLite no lo acepta
+    # directamente en un compound select)
+    doctor_sq = doctor_q.subquery()
+    cama_sq = cama_q.subquery()
+
+    doctor, cama = None, None
+    for kind, id_, nombre, numero in db.session.execute(
+        union_all(select(doctor_sq), select(cama_sq))
+    ):
+        if kind == 'd':
+            doctor = (id_, nombre)
+        else:
+            cama = (id_, numero)
+
+    return doctor, cama
+
+
 def get_visitas_activas(id_doctor=None, id_sala=None):
     """Obtiene visitas activas, opcionalmente filtradas por doctor o sala"""
     query = VisitaEmergencia.query.filter_by(estado='activa')
@@ -282,11 +395,96 @@ def generate_folio(mapper, connection, target):
     Ejemplo: 5+12+3+001
     """
     if not target.folio:
-        # Obtener consecutivo para la sala
-        consecutivo = get_next_consecutivo(target.id_sala)
+        target.folio = build_folio(target.id_paciente, target.id_doctor, target.id_sala)
+
+
+def build_folio(id_paciente, id_doctor, id_sala):
+    """
+    Construye el folio IDPACIENTE+IDDOCTOR+SALA+CONSECUTIVO, consumiendo
+    el siguiente consecutivo de la sala.
+
+    Los INSERT hechos con Core (insert().returning()) no disparan el evento
+    before_insert, así que deben llamar esta función explícitamente.
+    """
+    consecutivo = get_next_consecutivo(id_sala)
+    return f"{id_paciente}+{id_doctor}+{id_sala}+{consecutivo:03d}"
+
+
+def _unicode_lower(value):
+    return value.lower() if isinstance(value, str) else value
 
-        # Generar folio: IDPACIENTE+IDDOCTOR+SALA+CONSECUTIVO
-        target.folio = f"{target.id_paciente}+{target.id_doctor}+{target.id_sala}+{consecutivo:03d}"
+
+def register_unicode_lower(engine):
+    """
+    Registra unicode_lower() en las conexiones SQLite de engine.
+
+    lower() de SQLite solo convierte ASCII, así que no empataría 'Ángel' con
+    'ángel'. unicode_lower usa str.lower, el mismo que el filtrado local de
+    la TUI. El lower() nativo no se toca; en otros motores no hace nada.
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.create_function('unicode_lower', 1, _unicode_lower, deterministic=True)
+
+
+def upsert_paciente(nombre, edad, sexo, curp=None, telefono=None, contacto_emergencia=None):
+    """
+    Busca o crea un paciente en una sola sentencia y regresa su id_paciente.
+
+    Con CURP se usa INSERT ... ON CONFLICT (curp) DO UPDATE ... RETURNING;
+    si el paciente ya existe se regresa tal cual, sin modificar su fila.
+    Sin CURP es un INSERT normal.
+    """
+    from sqlalchemy import insert, select
+    from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    values = dict(
+        nombre=nombre,
+        edad=edad,
+        sexo=sexo,
+        curp=curp or None,
+        telefono=telefono,
+        contacto_emergencia=contacto_emergencia,
+        activo=1
+    )
+
+    if not curp:
+        stmt = insert(Paciente).values(**values)
+    else:
+        dialect = db.session.get_bind().dialect.name
+        dialect_insert = {'postgresql': pg_insert, 'sqlite': sqlite_insert}.get(dialect)
+
+        if dialect_insert is None:
+            # Motor sin ON CONFLICT: buscar y luego insertar. El INSERT va en
+            # un savepoint para que, si otra admisión gana la carrera con la
+            # misma CURP, solo se deshaga el savepoint y se lea su fila
+            paciente = Paciente.query.filter_by(curp=curp).first()
+            if paciente:
+                return paciente.id_paciente
+            try:
+                with db.session.begin_nested():
+                    return db.session.execute(
+                        insert(Paciente).values(**values).returning(Paciente.id_paciente)
+                    ).scalar_one()
+            except IntegrityError:
+                return db.session.execute(
+                    select(Paciente.id_paciente).where(Paciente.curp == curp)
+                ).scalar_one()
+        else:
+            stmt = dialect_insert(Paciente).values(**values)
+            # DO UPDATE (y no DO NOTHING) para que RETURNING siempre regrese
+            # la fila. Reasignar la misma CURP no cambia nada: como el buscar
+            # o crear anterior, un paciente existente se deja intacto
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['curp'], set_={'curp': stmt.excluded.curp}
+            )
+
+    return db.session.execute(stmt.returning(Paciente.id_paciente)).scalar_one()
 
 
 # ============================================================================
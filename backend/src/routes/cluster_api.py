@@ -376,8 +376,7 @@ def create_visit_distributed():
                 id_trabajador=data['id_trabajador'],
                 id_sala=data['id_sala'],
                 sintomas=data['sintomas'],
-                estado='activa',
-                timestamp=datetime.utcnow()
+                estado='activa'
             )
 
             # Marcar recursos como ocupados
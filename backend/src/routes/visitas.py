@@ -86,8 +86,7 @@ def crear_visita():
                 id_trabajador=id_trabajador,
                 id_sala=Config.NODE_ID,
                 sintomas=sintomas,
-                estado='activa',
-                timestamp=datetime.utcnow()
+                estado='activa'
             )
 
             db.session.add(visita)
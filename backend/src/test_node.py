@@ -8,18 +8,21 @@ import sys
 import logging
 import logging.handlers
 import os
+import threading
 import time
 from app_factory import create_app
 from bully import BullyNode
 from config import Config
 
 # Setup graceful shutdown
-running = True
+stop_event = threading.Event()
+
+# Intervalo (segundos) entre impresiones de estado
+STATUS_INTERVAL = 30
 
 def signal_handler(signum, frame):
-    global running
     print(f"\n[Node-{Config.NODE_ID}] Cerrando gracefully...")
-    running = False
+    stop_event.set()
 
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
@@ -30,8 +33,10 @@ def setup_logging(node_id):
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
+    # node_id is fixed for the process, so it goes straight into the format
+    # string instead of being injected per record by a filter
     log_format = logging.Formatter(
-        fmt='[%(asctime)s] [Node-%(node_id)s] [%(levelname)s] [%(name)s] %(message)s',
+        fmt=f'[%(asctime)s] [Node-{node_id}] [%(levelname)s] [%(name)s] %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
@@ -48,13 +53,6 @@ def setup_logging(node_id):
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(log_format)
 
-    # Add node_id filter
-    class NodeIdFilter(logging.Filter):
-        def filter(self, record):
-            record.node_id = node_id
-            return True
-
-    file_handler.addFilter(NodeIdFilter())
     root_logger.addHandler(file_handler)
 
     # Silence noisy libraries
@@ -63,8 +61,6 @@ def setup_logging(node_id):
 
 def main():
     """Main entry point"""
-    global running
-
     # Initialize NODE_ID (auto-generate if not specified)
     from config import Config
     node_id = Config.initialize_node_id()
@@ -79,16 +75,21 @@ def main():
     # Mostrar si el ID fue auto-generado
     id_source = "auto-generado" if Config.is_node_id_auto_generated() else "manual"
 
-    print(f"═══════════════════════════════════════════════════════════")
-    print(f"  Nodo {node_id} ({id_source}) - Modo de Prueba")
-    print(f"═══════════════════════════════════════════════════════════")
+    # Banner: se arma completo y se escribe con una sola llamada
+    banner = [
+        "═══════════════════════════════════════════════════════════",
+        f"  Nodo {node_id} ({id_source}) - Modo de Prueba",
+        "═══════════════════════════════════════════════════════════",
+    ]
 
     # Initialize Bully system
     logger.info("Initializing Bully node")
 
     if Config.is_dynamic_mode():
         # MODO DINÁMICO: Auto-descubrimiento via multicast
-        print(f"[Node-{node_id}] Modo dinámico: Auto-descubrimiento")
+        banner.append(f"[Node-{node_id}] Modo dinámico: Auto-descubrimiento")
+        sys.stdout.write("\n".join(banner) + "\n")
+        sys.stdout.flush()
         logger.info("Using DYNAMIC mode - auto-discovery enabled")
 
         bully_manager = BullyNode(
@@ -101,21 +102,16 @@ def main():
         )
         bully_manager.start()
         logger.info(f"Bully system started (DYNAMIC) - TCP:{Config.TCP_PORT}, UDP:{Config.UDP_PORT}")
-        print(f"[Node-{node_id}] ✓ Buscando otros nodos en la red...")
+        ready = [f"[Node-{node_id}] ✓ Buscando otros nodos en la red..."]
 
     else:
         # MODO ESTÁTICO: Lista fija de nodos
-        print(f"[Node-{node_id}] Modo estático: Lista fija de nodos")
+        banner.append(f"[Node-{node_id}] Modo estático: Lista fija de nodos")
+        sys.stdout.write("\n".join(banner) + "\n")
+        sys.stdout.flush()
         logger.info("Using STATIC mode - fixed cluster_nodes")
 
-        cluster_nodes = {}
-        for nodo_info in Config.OTROS_NODOS:
-            if nodo_info['id'] != node_id:
-                cluster_nodes[nodo_info['id']] = (
-                    'localhost',
-                    nodo_info['tcp_port'],
-                    6000 + nodo_info['id'] - 1
-                )
+        cluster_nodes = Config.build_static_cluster(node_id)
 
         bully_manager = BullyNode(
             node_id=node_id,
@@ -126,22 +122,25 @@ def main():
         )
         bully_manager.start()
         logger.info(f"Bully system started (STATIC) - TCP:{Config.TCP_PORT}, UDP:{Config.UDP_PORT}")
+        ready = []
 
-    print(f"[Node-{node_id}] ✓ Sistema iniciado")
-    print(f"[Node-{node_id}] Presiona Ctrl+C para detener")
-    print("")
+    ready.append(f"[Node-{node_id}] ✓ Sistema iniciado")
+    ready.append(f"[Node-{node_id}] Presiona Ctrl+C para detener")
+    sys.stdout.write("\n".join(ready) + "\n\n")
+    sys.stdout.flush()
 
-    # Main loop - just keep alive
+    # Main loop - dormir hasta una señal o hasta el siguiente estado programado
     try:
-        while running:
-            time.sleep(1)
-
-            # Log status every 30 seconds
-            if int(time.time()) % 30 == 0:
-                state = bully_manager.get_state()
-                leader = bully_manager.get_current_leader()
-                nodes_count = len(bully_manager.cluster_nodes)
-                print(f"[Node-{node_id}] Estado: {state} | Líder: Nodo {leader} | Nodos conocidos: {nodes_count}")
+        while not stop_event.is_set():
+            # Log status every 30 seconds (alineado al reloj)
+            if stop_event.wait(timeout=STATUS_INTERVAL - time.time() % STATUS_INTERVAL):
+                break
+
+            state = bully_manager.get_state()
+            leader = bully_manager.get_current_leader()
+            nodes_count = len(bully_manager.cluster_nodes)
+            sys.stdout.write(f"[Node-{node_id}] Estado: {state} | Líder: Nodo {leader} | Nodos conocidos: {nodes_count}\n")
+            sys.stdout.flush()
 
     except KeyboardInterrupt:
         pass
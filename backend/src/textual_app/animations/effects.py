@@ -8,6 +8,27 @@ from terminaltexteffects.utils.terminal import Terminal
 from terminaltexteffects.utils.graphics import Color, Gradient
 from typing import Iterator
 import asyncio
+import itertools
+
+
+# Slide direction mapping (resolved once at import)
+_DIRECTION_MAP = {
+    "diagonal": effect_slide.SlideDirection.DIAGONAL,
+    "horizontal": effect_slide.SlideDirection.HORIZONTAL,
+    "vertical": effect_slide.SlideDirection.VERTICAL,
+}
+
+# Spinner frames for SimpleAnimations.spinner
+_SPINNERS = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+
+# Beam colors (Color objects built once at import)
+_COLOR_MAP = {
+    "cyan": Color("00D9FF"),
+    "green": Color("00FF00"),
+    "blue": Color("0077BE"),
+    "magenta": Color("FF00FF"),
+    "yellow": Color("FFFF00"),
+}
 
 
 class TTEWrapper:
@@ -37,12 +58,7 @@ class TTEWrapper:
         effect.effect_config.grouping = "row"  # Animate by row
         
         # Direction mapping
-        direction_map = {
-            "diagonal": effect_slide.SlideDirection.DIAGONAL,
-            "horizontal": effect_slide.SlideDirection.HORIZONTAL,
-            "vertical": effect_slide.SlideDirection.VERTICAL,
-        }
-        effect.effect_config.direction = direction_map.get(direction, effect_slide.SlideDirection.DIAGONAL)
+        effect.effect_config.direction = _DIRECTION_MAP.get(direction, effect_slide.SlideDirection.DIAGONAL)
         
         # Generate frames
         with effect.terminal_output() as terminal:
@@ -92,14 +108,7 @@ class TTEWrapper:
         effect.effect_config.beam_column_symbols = "▌▐█"
         
         # Set colors based on parameter
-        color_map = {
-            "cyan": Color("00D9FF"),
-            "green": Color("00FF00"),
-            "blue": Color("0077BE"),
-            "magenta": Color("FF00FF"),
-            "yellow": Color("FFFF00"),
-        }
-        beam_gradient = Gradient(color_map.get(beam_color, Color("00D9FF")), 10)
+        beam_gradient = Gradient(_COLOR_MAP.get(beam_color, _COLOR_MAP["cyan"]), 10)
         effect.effect_config.beam_gradient = beam_gradient
         
         # Generate frames
@@ -127,16 +136,15 @@ class SimpleAnimations:
         """
         from rich.text import Text
         
+        # Only two distinct frames exist (alpha < 50 → dim, else bold)
+        dim = Text(text, style="dim")
+        bold = Text(text, style="bold")
+        
+        # Fade in (alpha 0→100) then fade out (alpha 100→0), in steps of 10
+        pattern = [dim] * 5 + [bold] * 6 + [bold] * 6 + [dim] * 5
+        
         for _ in range(count):
-            # Fade in
-            for alpha in range(0, 101, 10):
-                styled = Text(text, style=f"dim" if alpha < 50 else "bold")
-                yield styled
-                
-            # Fade out
-            for alpha in range(100, -1, -10):
-                styled = Text(text, style=f"dim" if alpha < 50 else "bold")
-                yield styled
+            yield from pattern
     
     @staticmethod
     def spinner(frames: int = 10) -> Iterator[str]:
@@ -146,13 +154,10 @@ class SimpleAnimations:
         Args:
             frames: Number of frames to generate
         
-        Yields:
-            Each spinner frame
+        Returns:
+            Iterator over the spinner frames
         """
-        spinners = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        
-        for i in range(frames):
-            yield spinners[i % len(spinners)]
+        return itertools.islice(itertools.cycle(_SPINNERS), frames)
     
     @staticmethod
     def progress_dots(text: str, max_dots: int = 3) -> Iterator[str]:
@@ -166,8 +171,6 @@ class SimpleAnimations:
         Yields:
             Text with animated dots
         """
-        import itertools
-        
         for dots in itertools.cycle(range(max_dots + 1)):
             yield f"{text}{'.' * dots}"
 
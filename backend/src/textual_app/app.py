@@ -13,6 +13,7 @@ from textual.driver import Driver
 # Import screens
 from .screens.splash import SplashScreen, SimpleSplashScreen
 from .screens.login import LoginScreen
+from .utils import init_db_executor, shutdown_db_executor
 
 # Version
 from . import __version__
@@ -61,6 +62,9 @@ class MedicalApp(App):
         self.flask_app = flask_app
         self.bully_manager = bully_manager
         self.use_simple_splash = use_simple_splash
+
+        # Shared DB worker pool (one app context per worker thread)
+        init_db_executor(flask_app)
         
         # Current user (set after login)
         self.current_user = None
@@ -107,6 +111,8 @@ class MedicalApp(App):
         # Cleanup Bully manager
         if self.bully_manager:
             self.bully_manager.stop()
+
+        shutdown_db_executor()
         
         self.exit()
 
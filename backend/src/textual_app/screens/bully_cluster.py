@@ -3,18 +3,30 @@ Bully Cluster Screen - Visual diagram of Bully consensus cluster
 """
 
 import time
-from datetime import datetime
 from typing import Dict, List, Tuple, Any
 
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, Label, Footer
 from textual.containers import Container, Vertical, Horizontal, Grid
+from textual.message import Message
 from textual.reactive import reactive
 from textual import work
 from textual.binding import Binding
+from rich.style import Style
 from rich.text import Text
 
+# Pre-parsed styles for ClusterNodeCard.render (called every second per card)
+_STYLE_BOLD = Style(bold=True)
+_STYLE_DIM = Style(dim=True)
+_STYLE_LEADER = Style(bold=True, color="green")
+_STYLE_FOLLOWER = Style(color="cyan")
+_STYLE_CURRENT = Style(bold=True, color="yellow")
+_STYLE_STALE = Style(dim=True, color="red")
+
+# A peer not seen for this many seconds is shown as stale
+_STALE_AFTER = 10
+
 
 class ClusterNodeCard(Static):
     """Card widget to display a single cluster node"""
@@ -54,43 +66,42 @@ class ClusterNodeCard(Static):
         """Render the node card"""
         # Calculate time since last seen
         time_ago = time.time() - self.last_seen if self.last_seen else 999
-        is_stale = time_ago > 10  # Stale if not seen in 10 seconds
+        # The current node is never stale: its last_seen is only refreshed on
+        # each cluster load, so it would age between ticks
+        is_stale = not self.is_current and time_ago > _STALE_AFTER
 
         # Build the card content
         content = Text()
 
         # Header: Node ID with badges
-        header = f"Node {self.node_id}"
-        if self.is_leader:
-            header += " 👑"
-        if self.is_current:
-            header += " 🔵"
-        if is_stale:
-            header += " ⚠"
-
-        content.append(header + "\n", style="bold")
+        header = (
+            f"Node {self.node_id}"
+            f"{' 👑' if self.is_leader else ''}"
+            f"{' 🔵' if self.is_current else ''}"
+            f"{' ⚠' if is_stale else ''}\n"
+        )
+        content.append(header, style=_STYLE_BOLD)
 
         # State
         if self.is_leader:
-            content.append("LEADER", style="bold green")
+            content.append("LEADER", style=_STYLE_LEADER)
         else:
-            content.append("FOLLOWER", style="cyan")
+            content.append("FOLLOWER", style=_STYLE_FOLLOWER)
 
         content.append("\n\n")
 
         # Ports
-        content.append(f"TCP: {self.tcp_port}\n", style="dim")
-        content.append(f"UDP: {self.udp_port}\n", style="dim")
+        content.append(f"TCP: {self.tcp_port}\nUDP: {self.udp_port}\n", style=_STYLE_DIM)
 
         content.append("\n")
 
         # Last seen
         if self.is_current:
-            content.append("Active (You)", style="bold yellow")
+            content.append("Active (You)", style=_STYLE_CURRENT)
         elif is_stale:
-            content.append(f"Last seen:\n{int(time_ago)}s ago", style="dim red")
+            content.append(f"Last seen:\n{int(time_ago)}s ago", style=_STYLE_STALE)
         else:
-            content.append(f"Last seen:\n{int(time_ago)}s ago", style="dim")
+            content.append(f"Last seen:\n{int(time_ago)}s ago", style=_STYLE_DIM)
 
         return content
 
@@ -183,9 +194,16 @@ class BullyClusterScreen(Screen):
     }
     """
 
+    class ClusterChanged(Message):
+        """Posted from Bully threads when the manager reports a state change"""
+
     # Reactive state
-    cluster_data: reactive[Dict[str, Any]] = reactive({}, init=False)
-    refresh_interval: int = 2  # seconds
+    # always_update: an unchanged cluster still needs its last-seen pass
+    cluster_data: reactive[Dict[str, Any]] = reactive({}, init=False, always_update=True)
+    # Safety tick (updates are push-based). It also drives the stale class of
+    # silent peers, so it stays below _STALE_AFTER
+    refresh_interval: int = 5  # seconds
+    timestamp_interval: int = 5  # seconds between "Last updated" refreshes
 
     def __init__(self, bully_manager):
         super().__init__()
@@ -195,6 +213,14 @@ class BullyClusterScreen(Screen):
         # Maps node_id -> ClusterNodeCard widget
         self.node_cards: Dict[int, ClusterNodeCard] = {}
 
+        # Status bar cache: (leader, cluster_size, state) of the last rebuild
+        # and the summary line built for it
+        self._status_hash = None
+        self._status_summary: Text = Text()
+
+        # Fingerprint of the last cluster_data rendered by watch_cluster_data
+        self._last_fp = None
+
     def compose(self) -> ComposeResult:
         """Compose the cluster visualization UI"""
 
@@ -221,37 +247,49 @@ class BullyClusterScreen(Screen):
         # Load initial data
         self.load_cluster_data()
 
-        # Start auto-refresh
+        # Push-based updates: the manager notifies us on membership/leader/term
+        # changes. post_message is thread-safe and doesn't block the Bully thread
+        self.bully_manager.add_state_listener(self._on_bully_state_change)
+
+        # Low-rate safety tick in case a notification is missed
         self.set_interval(self.refresh_interval, self.load_cluster_data)
 
+        # The "Last updated" line is refreshed on its own, slower timer
+        self.set_interval(self.timestamp_interval, self.update_status_timestamp)
+
+    def on_unmount(self) -> None:
+        """Stop receiving Bully notifications once the screen is gone"""
+        self.bully_manager.remove_state_listener(self._on_bully_state_change)
+
+    def _on_bully_state_change(self) -> None:
+        """State listener registered on the Bully manager (runs off the UI thread)"""
+        self.post_message(self.ClusterChanged())
+
+    def on_bully_cluster_screen_cluster_changed(self, message: ClusterChanged) -> None:
+        """Reload cluster data on the UI thread after a Bully state change"""
+        self.load_cluster_data()
+
     def load_cluster_data(self) -> None:
         """Load cluster data from Bully manager"""
         try:
-            # Get current cluster state
-            current_node = self.bully_manager.node_id
-            current_leader = self.bully_manager.current_leader
-            state = self.bully_manager.state.value
-            cluster_nodes = self.bully_manager.cluster_nodes
-            node_last_seen = self.bully_manager.node_last_seen
-            election_in_progress = self.bully_manager.election_in_progress
-            current_term = self.bully_manager.current_term
-            use_discovery = self.bully_manager.use_discovery
-
-            # CRITICAL FIX: Create deep copies of mutable dictionaries
-            # This ensures Textual's reactive system detects changes
-            # Without this, cluster_nodes and node_last_seen are references to the same objects,
-            # so Textual won't trigger watch_cluster_data() when they're modified
+            # Read all manager state under a single lock so leader/state/term
+            # are consistent with each other (no torn reads during elections)
+            snap = self.bully_manager.snapshot()
+
+            # snapshot() copies the dicts under the manager's lock (and reuses
+            # that copy while membership is unchanged), so they can be iterated
+            # here while discovery threads add or remove nodes
             self.cluster_data = {
-                'current_node': current_node,
-                'current_leader': current_leader,
-                'state': state,
-                'cluster_nodes': dict(cluster_nodes),  # Create new dict copy
-                'node_last_seen': dict(node_last_seen),  # Create new dict copy
-                'election_in_progress': election_in_progress,
-                'current_term': current_term,
-                'use_discovery': use_discovery,
-                'tcp_port': self.bully_manager.tcp_port,
-                'udp_port': self.bully_manager.udp_port,
+                'current_node': snap['node_id'],
+                'current_leader': snap['current_leader'],
+                'state': snap['state'],
+                'cluster_nodes': snap['cluster_nodes'],
+                'node_last_seen': snap['node_last_seen'],
+                'election_in_progress': snap['election_in_progress'],
+                'current_term': snap['current_term'],
+                'use_discovery': snap['use_discovery'],
+                'tcp_port': snap['tcp_port'],
+                'udp_port': snap['udp_port'],
             }
 
         except Exception as e:
@@ -262,6 +300,22 @@ class BullyClusterScreen(Screen):
         if not data:
             return
 
+        # Last seen and stale state depend on the clock, not just on the data,
+        # so they are refreshed on every load before the fingerprint check
+        self.update_nodes_liveness(data)
+
+        # Skip re-rendering when nothing else visible changed
+        fp = hash((
+            data['current_leader'],
+            data['state'],
+            data['current_term'],
+            data['election_in_progress'],
+            tuple(sorted(data['cluster_nodes'].items())),
+        ))
+        if fp == self._last_fp:
+            return
+        self._last_fp = fp
+
         # Update header info
         self.update_header_info(data)
 
@@ -306,10 +360,26 @@ class BullyClusterScreen(Screen):
         else:
             warning.display = False
 
+    def update_nodes_liveness(self, data: Dict[str, Any]) -> None:
+        """Refresh last seen and the stale class of the existing node cards"""
+        now = time.time()
+
+        for node_id, card in self.node_cards.items():
+            if node_id == data['current_node']:
+                card.last_seen = now  # Current node is always active
+                continue
+            last_seen = data['node_last_seen'].get(node_id, 0)
+            card.last_seen = last_seen
+            time_ago = now - last_seen if last_seen else 999
+            card.set_class(time_ago > _STALE_AFTER, "node-stale")
+
     def update_nodes_grid(self, data: Dict[str, Any]) -> None:
         """Update the nodes grid with current cluster state using incremental updates"""
         grid = self.query_one("#nodes-grid", Grid)
 
+        # One clock read per refresh so every card's stale check uses the same instant
+        now = time.time()
+
         # Build list of all nodes (current + cluster)
         all_nodes: Dict[int, Tuple[str, int, int]] = {}
 
@@ -338,25 +408,21 @@ class BullyClusterScreen(Screen):
 
             # Get last seen time
             if is_current:
-                last_seen = time.time()  # Current node is always active
+                last_seen = now  # Current node is always active
             else:
                 last_seen = data['node_last_seen'].get(node_id, 0)
 
             # Check if card already exists
             if node_id in self.node_cards:
-                # Update existing card's reactive properties
+                # Update existing card's reactive properties; last seen and
+                # stale state are kept current by update_nodes_liveness
                 card = self.node_cards[node_id]
                 card.is_leader = is_leader
                 card.is_current = is_current
-                card.last_seen = last_seen
 
                 # Update CSS classes dynamically
                 card.set_class(is_leader, "node-leader")
                 card.set_class(is_current, "node-current")
-
-                # Check if stale
-                time_ago = time.time() - last_seen if last_seen else 999
-                card.set_class(time_ago > 10 and not is_current, "node-stale")
             else:
                 # Create new card
                 card = ClusterNodeCard(
@@ -375,8 +441,8 @@ class BullyClusterScreen(Screen):
                     card.add_class("node-current")
 
                 # Check if stale
-                time_ago = time.time() - last_seen if last_seen else 999
-                if time_ago > 10 and not is_current:
+                time_ago = now - last_seen if last_seen else 999
+                if time_ago > _STALE_AFTER and not is_current:
                     card.add_class("node-stale")
 
                 # Mount and cache the card
@@ -385,10 +451,15 @@ class BullyClusterScreen(Screen):
 
     def update_status_bar(self, data: Dict[str, Any]) -> None:
         """Update status bar with cluster summary"""
-        status_bar = self.query_one("#status-bar", Static)
-
         leader_text = f"Node {data['current_leader']}" if data['current_leader'] else "None"
         cluster_size = len(data['cluster_nodes']) + 1  # +1 for current node
+
+        # Skip the rebuild while the cluster is stable (the common case)
+        status_hash = (data['current_leader'], cluster_size, data['state'])
+        if status_hash == self._status_hash:
+            return
+        self._status_hash = status_hash
+
         your_state = data['state'].upper()
 
         status_text = Text()
@@ -405,8 +476,16 @@ class BullyClusterScreen(Screen):
         else:
             status_text.append(your_state, style="bold cyan")
 
+        self._status_summary = status_text
+        self.update_status_timestamp()
+
+    def update_status_timestamp(self) -> None:
+        """Redraw the status bar with the cached summary and a fresh timestamp"""
+        status_bar = self.query_one("#status-bar", Static)
+
+        status_text = self._status_summary.copy()
         status_text.append("\n")
-        status_text.append(f"Last updated: {datetime.now().strftime('%H:%M:%S')}", style="dim italic")
+        status_text.append(f"Last updated: {time.strftime('%H:%M:%S')}", style="dim italic")
 
         status_bar.update(status_text)
 
@@ -2,12 +2,14 @@
 Create Visit Wizard - Multi-step wizard for creating emergency visits
 """
 
-import asyncio
-from typing import Dict, Any, List, Tuple, Optional
-from datetime import datetime
+import threading
+import time
+from typing import Dict, Any, Callable, List, Set, Tuple, Optional, Type, TypeVar
 
+from sqlalchemy import insert, update
 from textual.app import ComposeResult
 from textual.screen import Screen
+from textual.widget import Widget
 from textual.widgets import Static, Input, Button, Label, Select
 from textual.containers import Container, Vertical, Horizontal
 from textual.reactive import reactive
@@ -15,6 +17,100 @@ from textual import work
 from textual.binding import Binding
 from rich.text import Text
 
+from models import (
+    db, Cama, Doctor, VisitaEmergencia, build_folio, get_doctores_y_camas, upsert_paciente
+)
+from ..utils import run_db
+
+
+# Loaded resources: (doctors, beds) as (id, label) pairs sorted by id.
+# Everything is an immutable tuple so a cached result can be shared as-is.
+Choices = Tuple[Tuple[int, str], ...]
+Resources = Tuple[Choices, Choices]
+
+# Process-wide cache of available resources per node:
+# node_id -> (loaded_at, resources). The catalog rarely changes, so
+# reopening the wizard within the TTL is served from memory.
+_RESOURCES_TTL = 10.0  # seconds
+_RESOURCES_CACHE: Dict[int, Tuple[float, Resources]] = {}
+_RESOURCES_LOCK = threading.Lock()
+
+WidgetType = TypeVar("WidgetType", bound=Widget)
+
+
+def _is_int(value: str) -> bool:
+    try:
+        int(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_valid_age(value: str) -> bool:
+    return 0 <= int(value) <= 150
+
+
+# Field rules per step: step -> [(widget_id, rule, error)]. Each rule gets the
+# widget value (stripped if text); the first one that fails is reported, so
+# later rules may assume earlier ones passed.
+_RULES: Dict[int, List[Tuple[str, Callable[[Any], bool], str]]] = {
+    1: [
+        ("input-nombre", bool, "❌ El nombre es requerido"),
+        ("input-edad", bool, "❌ La edad es requerida"),
+        ("input-edad", _is_int, "❌ La edad debe ser un número"),
+        ("input-edad", _is_valid_age, "❌ Edad inválida (0-150)"),
+        ("select-sexo", bool, "❌ El sexo es requerido"),
+    ],
+    2: [
+        ("select-doctor", bool, "❌ Debe seleccionar un doctor"),
+        ("select-bed", bool, "❌ Debe seleccionar una cama"),
+    ],
+    3: [
+        ("input-sintomas", bool, "❌ Los síntomas son requeridos"),
+        ("input-sintomas", lambda v: len(v) >= 10,
+         "❌ Describa los síntomas con más detalle (mín. 10 caracteres)"),
+    ],
+}
+
+
+class VisitForm:
+    """Values collected by the wizard, one slot per field (no per-instance dict)"""
+
+    __slots__ = (
+        # Step 1: Patient
+        'nombre', 'edad', 'sexo', 'curp', 'telefono', 'contacto_emergencia',
+        # Step 2: Resources
+        'id_doctor', 'id_cama',
+        # Step 3: Symptoms
+        'sintomas',
+    )
+
+    def __init__(
+        self,
+        nombre: str = '',
+        edad: str = '',
+        sexo: Any = '',
+        curp: Optional[str] = None,
+        telefono: Optional[str] = None,
+        contacto_emergencia: Optional[str] = None,
+        id_doctor: Optional[int] = None,
+        id_cama: Optional[int] = None,
+        sintomas: str = '',
+    ):
+        self.nombre = nombre
+        self.edad = edad
+        self.sexo = sexo
+        self.curp = curp
+        self.telefono = telefono
+        self.contacto_emergencia = contacto_emergencia
+        self.id_doctor = id_doctor
+        self.id_cama = id_cama
+        self.sintomas = sintomas
+
+    def values(self) -> Tuple[Any, ...]:
+        """All field values in slot order (hashable)"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
 
 class CreateVisitWizard(Screen):
     """
@@ -148,8 +244,10 @@ class CreateVisitWizard(Screen):
     current_step: reactive[int] = reactive(1, init=False)
     total_steps: int = 4
 
-    # Form data
-    form_data: Dict[str, Any] = {}
+    # Available resources, filled in by the background loader. always_update so
+    # step 2 re-renders even when the loaded list equals the (empty) default
+    available_doctors: reactive[Choices] = reactive(tuple, init=False, always_update=True)
+    available_beds: reactive[Choices] = reactive(tuple, init=False, always_update=True)
 
     def __init__(self, flask_app, bully_manager, username: str):
         super().__init__()
@@ -157,25 +255,33 @@ class CreateVisitWizard(Screen):
         self.bully_manager = bully_manager
         self.username = username
 
-        # Available resources
-        self.available_doctors: List[Tuple[int, str]] = []
-        self.available_beds: List[Tuple[int, str]] = []
+        # Set once the background loader has delivered resources
+        self.resources_loaded = False
+
+        # Widget references by id, so repeated validation doesn't walk the DOM
+        self._widgets: Dict[str, Widget] = {}
+
+        # Regions ("steps", "content", "buttons", "error") whose widgets need
+        # an update; _flush() only touches these
+        self._dirty: Set[str] = set()
+        self._error_text = ""
+
+        # Step 4 summary keyed by a hash of the form values: (hash, rendered)
+        self._summary_cache: Optional[Tuple[int, Text]] = None
+
+        # Step indicators and static step bodies don't change between
+        # transitions, so build them once. Steps 2 (resources) and 4 (summary)
+        # depend on loaded data and are rendered on demand.
+        self._step_indicators: List[Text] = [
+            self._build_indicator(i) for i in range(1, self.total_steps + 1)
+        ]
+        self._step_bodies: Dict[int, Text] = {
+            1: self.render_step1_patient(),
+            3: self.render_step3_symptoms(),
+        }
 
         # Initialize form data
-        self.form_data = {
-            # Step 1: Patient
-            'nombre': '',
-            'edad': '',
-            'sexo': '',
-            'curp': '',
-            'telefono': '',
-            'contacto_emergencia': '',
-            # Step 2: Resources
-            'id_doctor': None,
-            'id_cama': None,
-            # Step 3: Symptoms
-            'sintomas': '',
-        }
+        self.form = VisitForm()
 
     def compose(self) -> ComposeResult:
         """Compose the wizard UI"""
@@ -197,76 +303,151 @@ class CreateVisitWizard(Screen):
 
     def on_mount(self) -> None:
         """Initialize wizard"""
-        # Load available resources
-        self.load_resources()
-
-        # Show first step
+        # Cache references to the fixed widgets
+        for widget_id, widget_type in (
+            ("wizard-steps", Static),
+            ("step-container", Static),
+            ("error-message", Static),
+            ("btn-back", Button),
+            ("btn-next", Button),
+        ):
+            self._widget(widget_id, widget_type)
+
+        # Show first step right away; resources load in the background
         self.update_step_display()
+        self._load_resources_worker()
+
+    def _widget(self, widget_id: str, expect_type: Type[WidgetType]) -> WidgetType:
+        """
+        Return a widget by id, querying the DOM only the first time (or after
+        the widget was removed). Raises NoMatches if it isn't rendered yet.
+        """
+        widget = self._widgets.get(widget_id)
+        if widget is None or not widget.is_attached:
+            widget = self.query_one(f"#{widget_id}", expect_type)
+            self._widgets[widget_id] = widget
+        return widget
+
+    @staticmethod
+    def invalidate_resources(node_id: int) -> None:
+        """Drop cached resources for a node (e.g. after a bed gets occupied)"""
+        with _RESOURCES_LOCK:
+            _RESOURCES_CACHE.pop(node_id, None)
 
-    def load_resources(self) -> None:
-        """Load available doctors and beds from database"""
+    @work(exclusive=True)
+    async def _load_resources_worker(self) -> None:
+        """Load available doctors and beds off the UI thread"""
         try:
-            with self.flask_app.app_context():
-                from models import get_doctores_disponibles, get_camas_disponibles
-                from config import Config
-
-                # Get available doctors
-                doctores = get_doctores_disponibles(id_sala=self.bully_manager.node_id)
-                self.available_doctors = [
-                    (d.id_doctor, f"{d.nombre} - {d.especialidad}")
-                    for d in doctores
-                ]
-
-                # Get available beds
-                camas = get_camas_disponibles(id_sala=self.bully_manager.node_id)
-                self.available_beds = [
-                    (c.id_cama, f"Cama {c.numero} - Sala {c.id_sala}")
-                    for c in camas
-                ]
-
+            resources = await run_db(self.load_resources)
         except Exception as e:
             self.notify(f"Error loading resources: {str(e)}", severity="error")
+            resources = ((), ())
+
+        self._apply_resources(resources)
+
+    def load_resources(self) -> Resources:
+        """
+        Fetch available doctors and beds (cached for _RESOURCES_TTL seconds).
+        Blocking - runs on the DB executor.
+        """
+        node_id = self.bully_manager.node_id
+
+        with _RESOURCES_LOCK:
+            cached = _RESOURCES_CACHE.get(node_id)
+        if cached and time.monotonic() - cached[0] < _RESOURCES_TTL:
+            return cached[1]
+
+        # Available doctors and beds in one round trip. Sorted by id so the
+        # order doesn't depend on what the DB happens to return
+        doctors, beds = get_doctores_y_camas(id_sala=node_id)
+        resources = (tuple(sorted(doctors)), tuple(sorted(beds)))
+
+        with _RESOURCES_LOCK:
+            _RESOURCES_CACHE[node_id] = (time.monotonic(), resources)
+
+        return resources
+
+    def _apply_resources(self, resources: Resources) -> None:
+        """Store loaded resources"""
+        doctors, beds = resources
+        self.resources_loaded = True
+        self.available_doctors = doctors
+        self.available_beds = beds
+
+    def watch_available_doctors(self, doctors: Choices) -> None:
+        """Re-render step 2 when doctors change"""
+        self._refresh_resources_step()
+
+    def watch_available_beds(self, beds: Choices) -> None:
+        """Re-render step 2 when beds change"""
+        self._refresh_resources_step()
+
+    def _refresh_resources_step(self) -> None:
+        """Re-render the resources step if it is the one on screen"""
+        if self.current_step == 2:
+            self._mark("content")
+            self._flush()
 
     def watch_current_step(self, step: int) -> None:
         """React to step changes"""
         self.update_step_display()
 
-    def update_step_display(self) -> None:
-        """Update UI for current step"""
-        # Update step indicator
+    def _build_indicator(self, step: int) -> Text:
+        """Build the step indicator line for a given step"""
         steps_text = Text()
         for i in range(1, self.total_steps + 1):
-            if i == self.current_step:
+            if i == step:
                 steps_text.append(f"● ", style="bold green")
-            elif i < self.current_step:
+            elif i < step:
                 steps_text.append(f"✓ ", style="green")
             else:
                 steps_text.append(f"○ ", style="dim")
 
         step_names = ["Paciente", "Recursos", "Síntomas", "Confirmar"]
-        steps_text.append(f"{step_names[self.current_step - 1]} ({self.current_step}/{self.total_steps})")
+        steps_text.append(f"{step_names[step - 1]} ({step}/{self.total_steps})")
+        return steps_text
+
+    def update_step_display(self) -> None:
+        """Update UI for current step"""
+        self._mark("steps", "content", "buttons")
+        self._set_error("")
+        self._flush()
+
+    def _mark(self, *regions: str) -> None:
+        """Flag regions for the next _flush()"""
+        self._dirty.update(regions)
+
+    def _set_error(self, message: str) -> None:
+        """Set the error line; only marks it dirty if the text changed"""
+        if message != self._error_text:
+            self._error_text = message
+            self._dirty.add("error")
+
+    def _flush(self) -> None:
+        """Push pending changes to the widgets, touching only dirty regions"""
+        dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
 
-        steps_widget = self.query_one("#wizard-steps", Static)
-        steps_widget.update(steps_text)
+        step = self.current_step
 
-        # Update step content
-        step_container = self.query_one("#step-container", Static)
+        if "steps" in dirty:
+            self._widget("wizard-steps", Static).update(self._step_indicators[step - 1])
 
-        if self.current_step == 1:
-            step_container.update(self.render_step1_patient())
-        elif self.current_step == 2:
-            step_container.update(self.render_step2_resources())
-        elif self.current_step == 3:
-            step_container.update(self.render_step3_symptoms())
-        elif self.current_step == 4:
-            step_container.update(self.render_step4_confirmation())
+        if "content" in dirty:
+            step_container = self._widget("step-container", Static)
+            if step == 2:
+                step_container.update(self.render_step2_resources())
+            elif step == 4:
+                step_container.update(self.render_step4_confirmation())
+            else:
+                step_container.update(self._step_bodies[step])
 
-        # Update buttons
-        self.update_buttons()
+        if "buttons" in dirty:
+            self.update_buttons()
 
-        # Clear error message
-        error_widget = self.query_one("#error-message", Static)
-        error_widget.update("")
+        if "error" in dirty:
+            self._widget("error-message", Static).update(self._error_text)
 
     def render_step1_patient(self) -> Text:
         """Render Step 1: Patient Information"""
@@ -283,6 +464,10 @@ class CreateVisitWizard(Screen):
         content.append("RECURSOS MÉDICOS\n\n", style="bold cyan")
         content.append("Seleccione doctor y cama disponibles:\n\n", style="dim")
 
+        if not self.resources_loaded:
+            content.append("⏳ Cargando recursos…\n", style="yellow")
+            return content
+
         if not self.available_doctors:
             content.append("⚠ No hay doctores disponibles\n", style="bold red")
         if not self.available_beds:
@@ -299,34 +484,39 @@ class CreateVisitWizard(Screen):
         return content
 
     def render_step4_confirmation(self) -> Text:
-        """Render Step 4: Confirmation"""
+        """Render Step 4: Confirmation (memoized on the form values)"""
+        form_hash = hash(self.form.values())
+        if self._summary_cache and self._summary_cache[0] == form_hash:
+            return self._summary_cache[1]
+
         content = Text()
         content.append("CONFIRMACIÓN\n\n", style="bold cyan")
         content.append("Revise los datos antes de crear la visita:\n\n", style="dim")
 
         # Summary
         content.append("Paciente: ", style="dim")
-        content.append(f"{self.form_data.get('nombre', 'N/A')}\n", style="bold")
+        content.append(f"{self.form.nombre}\n", style="bold")
 
         content.append("Edad: ", style="dim")
-        content.append(f"{self.form_data.get('edad', 'N/A')} años\n", style="bold")
+        content.append(f"{self.form.edad} años\n", style="bold")
 
         content.append("Sexo: ", style="dim")
-        content.append(f"{self.form_data.get('sexo', 'N/A')}\n", style="bold")
+        content.append(f"{self.form.sexo}\n", style="bold")
 
-        if self.form_data.get('curp'):
+        if self.form.curp:
             content.append("CURP: ", style="dim")
-            content.append(f"{self.form_data['curp']}\n", style="bold")
+            content.append(f"{self.form.curp}\n", style="bold")
 
         content.append("\nSíntomas: ", style="dim")
-        content.append(f"{self.form_data.get('sintomas', 'N/A')}\n\n", style="bold")
+        content.append(f"{self.form.sintomas}\n\n", style="bold")
 
+        self._summary_cache = (form_hash, content)
         return content
 
     def update_buttons(self) -> None:
         """Update button visibility and labels"""
-        btn_back = self.query_one("#btn-back", Button)
-        btn_next = self.query_one("#btn-next", Button)
+        btn_back = self._widget("btn-back", Button)
+        btn_next = self._widget("btn-next", Button)
 
         # Back button
         btn_back.disabled = (self.current_step == 1)
@@ -356,103 +546,69 @@ class CreateVisitWizard(Screen):
     def action_next(self) -> None:
         """Go to next step or create visit"""
         # Validate current step
-        if not self.validate_current_step():
+        if not self.is_current_step_valid():
+            # Only the error line changed
+            self._flush()
             return
 
         # Save current step data
         self.save_current_step_data()
 
         if self.current_step < self.total_steps:
-            # Go to next step
+            # Go to next step (watcher flushes everything)
             self.current_step += 1
         else:
             # Create visit
+            self._flush()
             self.create_visit()
 
-    def validate_current_step(self) -> bool:
-        """Validate current step data"""
-        error_widget = self.query_one("#error-message", Static)
-
-        if self.current_step == 1:
-            # Validate patient data
-            try:
-                nombre_input = self.query_one("#input-nombre", Input)
-                edad_input = self.query_one("#input-edad", Input)
-                sexo_select = self.query_one("#select-sexo", Select)
-
-                if not nombre_input.value.strip():
-                    error_widget.update("❌ El nombre es requerido")
-                    return False
-
-                if not edad_input.value.strip():
-                    error_widget.update("❌ La edad es requerida")
-                    return False
-
-                try:
-                    edad = int(edad_input.value)
-                    if edad < 0 or edad > 150:
-                        error_widget.update("❌ Edad inválida (0-150)")
-                        return False
-                except ValueError:
-                    error_widget.update("❌ La edad debe ser un número")
-                    return False
-
-                if not sexo_select.value:
-                    error_widget.update("❌ El sexo es requerido")
-                    return False
-
-            except Exception:
-                # Inputs not yet rendered
-                pass
+    def is_current_step_valid(self) -> bool:
+        """Validate current step data (sets the error line, caller flushes)"""
+        if self.current_step == 2:
+            # Selections only matter once there is something to select
+            if not self.resources_loaded:
+                self._set_error("⏳ Cargando recursos…")
+                return False
 
-        elif self.current_step == 2:
-            # Validate resources
             if not self.available_doctors:
-                error_widget.update("❌ No hay doctores disponibles")
+                self._set_error("❌ No hay doctores disponibles")
                 return False
 
             if not self.available_beds:
-                error_widget.update("❌ No hay camas disponibles")
+                self._set_error("❌ No hay camas disponibles")
                 return False
 
-            # Check selections
-            try:
-                doctor_select = self.query_one("#select-doctor", Select)
-                bed_select = self.query_one("#select-bed", Select)
-
-                if not doctor_select.value:
-                    error_widget.update("❌ Debe seleccionar un doctor")
-                    return False
-
-                if not bed_select.value:
-                    error_widget.update("❌ Debe seleccionar una cama")
-                    return False
-            except Exception:
-                pass
-
-        elif self.current_step == 3:
-            # Validate symptoms
-            try:
-                sintomas_input = self.query_one("#input-sintomas", Input)
-
-                if not sintomas_input.value.strip():
-                    error_widget.update("❌ Los síntomas son requeridos")
-                    return False
-
-                if len(sintomas_input.value.strip()) < 10:
-                    error_widget.update("❌ Describa los síntomas con más detalle (mín. 10 caracteres)")
+        try:
+            for widget_id, rule, message in _RULES.get(self.current_step, ()):
+                value = self._widget(widget_id, Widget).value
+                if isinstance(value, str):
+                    value = value.strip()
+                if not rule(value):
+                    self._set_error(message)
                     return False
-            except Exception:
-                pass
+        except Exception:
+            # Inputs not yet rendered
+            pass
 
-        error_widget.update("")
+        self._set_error("")
         return True
 
     def save_current_step_data(self) -> None:
-        """Save current step data to form_data"""
-        # Implementation depends on actual input widgets
-        # This is a placeholder
-        pass
+        """Save current step data to the form"""
+        self._summary_cache = None
+        try:
+            if self.current_step == 1:
+                self.form.nombre = self._widget("input-nombre", Input).value.strip()
+                self.form.edad = self._widget("input-edad", Input).value.strip()
+                self.form.sexo = self._widget("select-sexo", Select).value
+            elif self.current_step == 2:
+                self.form.id_doctor = self._widget("select-doctor", Select).value
+                self.form.id_cama = self._widget("select-bed", Select).value
+            elif self.current_step == 3:
+                self.form.sintomas = self._widget("input-sintomas", Input).value.strip()
+        except Exception:
+            # Inputs not yet rendered
+            pass
 
     @work(exclusive=True)
     async def create_visit(self) -> None:
@@ -461,7 +617,7 @@ class CreateVisitWizard(Screen):
 
         try:
             # Create visit in database
-            result = await asyncio.to_thread(self._create_visit_in_db)
+            result = await run_db(self._create_visit_in_db)
 
             if result['success']:
                 self.notify(
@@ -483,61 +639,73 @@ class CreateVisitWizard(Screen):
             self.notify(f"❌ Error inesperado: {str(e)}", severity="error")
 
     def _create_visit_in_db(self) -> Dict[str, Any]:
-        """Create visit in database (runs in thread pool)"""
-        with self.flask_app.app_context():
-            from models import db, VisitaEmergencia, Paciente, Doctor, Cama
-
-            try:
-                # 1. Create or find patient
-                curp = self.form_data.get('curp')
-                paciente = None
-
-                if curp:
-                    paciente = Paciente.query.filter_by(curp=curp).first()
-
-                if not paciente:
-                    paciente = Paciente(
-                        nombre=self.form_data['nombre'],
-                        edad=int(self.form_data['edad']),
-                        sexo=self.form_data['sexo'],
-                        curp=curp if curp else None,
-                        telefono=self.form_data.get('telefono'),
-                        contacto_emergencia=self.form_data.get('contacto_emergencia'),
-                        activo=1
-                    )
-                    db.session.add(paciente)
-                    db.session.flush()
-
-                # 2. Create visit
-                visita = VisitaEmergencia(
-                    id_paciente=paciente.id_paciente,
-                    id_doctor=self.form_data['id_doctor'],
-                    id_cama=self.form_data['id_cama'],
+        """Create visit in database (runs on the DB executor)"""
+        try:
+            # 1. Create or find patient (single upsert keyed on curp)
+            id_paciente = upsert_paciente(
+                nombre=self.form.nombre,
+                edad=int(self.form.edad),
+                sexo=self.form.sexo,
+                curp=self.form.curp,
+                telefono=self.form.telefono,
+                contacto_emergencia=self.form.contacto_emergencia
+            )
+
+            # 2. Create visit. A Core INSERT ... RETURNING gives back the keys
+            # in the same round trip instead of a refresh() SELECT after
+            # commit; it skips the ORM before_insert event, so the folio is
+            # built here.
+            id_sala = self.bully_manager.node_id
+            folio, id_visita = db.session.execute(
+                insert(VisitaEmergencia)
+                .values(
+                    folio=build_folio(id_paciente, self.form.id_doctor, id_sala),
+                    id_paciente=id_paciente,
+                    id_doctor=self.form.id_doctor,
+                    id_cama=self.form.id_cama,
                     id_trabajador=1,  # TODO: Get from current user
-                    id_sala=self.bully_manager.node_id,
-                    sintomas=self.form_data['sintomas'],
-                    estado='activa',
-                    timestamp=datetime.utcnow()
+                    id_sala=id_sala,
+                    sintomas=self.form.sintomas,
+                    estado='activa'
+                )
+                .returning(VisitaEmergencia.folio, VisitaEmergencia.id_visita)
+            ).one()
+
+            # 3. Take the chosen doctor and bed, as the simple screen does.
+            # Conditional, so a doctor or bed taken since step 2 was shown
+            # fails the creation instead of being assigned twice
+            cama_tomada = db.session.execute(
+                update(Cama)
+                .where(Cama.id_cama == self.form.id_cama, Cama.ocupada == False)
+                .values(ocupada=True, id_paciente=id_paciente)
+            ).rowcount
+            doctor_tomado = db.session.execute(
+                update(Doctor)
+                .where(Doctor.id_doctor == self.form.id_doctor, Doctor.disponible == True)
+                .values(disponible=False)
+            ).rowcount
+            if cama_tomada != 1 or doctor_tomado != 1:
+                raise ValueError(
+                    'El doctor o la cama ya no están disponibles, elija otros'
                 )
 
-                db.session.add(visita)
-                db.session.commit()
+            db.session.commit()
 
-                # Refresh to get generated folio
-                db.session.refresh(visita)
+            # The assigned doctor and bed are no longer free
+            self.invalidate_resources(self.bully_manager.node_id)
 
-                return {
-                    'success': True,
-                    'folio': visita.folio,
-                    'id_visita': visita.id_visita
-                }
+            return {
+                'success': True,
+                'folio': folio,
+                'id_visita': id_visita
+            }
 
-            except Exception as e:
-                db.session.rollback()
-                return {
-                    'success': False,
-                    'error': str(e)
-                }
+        except Exception as e:
+            db.session.rollback()
+            return {
+                'success': False,
+                'error': str(e)
+            }
 
     def action_cancel(self) -> None:
         """Cancel wizard"""
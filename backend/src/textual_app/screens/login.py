@@ -3,14 +3,97 @@ Login Screen - User authentication with real database validation
 """
 
 import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import bcrypt
+from sqlalchemy import bindparam, select
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, Input, Button, Label
 from textual.containers import Container, Vertical, Horizontal, Center
+from textual.reactive import reactive
 from textual import work
+from rich.align import Align
+from rich.markup import escape
 from rich.text import Text
 from rich.panel import Panel
 
+from auth import get_user_info, is_username_known_missing, remember_missing_username
+from models import db, Usuario
+from ..utils import run_db
+
+
+@dataclass
+class UserRow:
+    """Plain copy of what login needs from a Usuario, detached from the session"""
+    __slots__ = ('id', 'activo', 'pw_hash')
+
+    id: int
+    activo: bool
+    pw_hash: str
+
+
+# User lookup statement, built once and reused for every login attempt.
+# Only the columns the password check needs; the rest of the user is loaded
+# by _fetch_user_info after a successful login.
+_USER_STMT = (
+    select(Usuario.id, Usuario.activo, Usuario.password_hash)
+    .where(Usuario.username == bindparam("u"))
+)
+
+# Failed attempts per username: username -> (failures, last_failure_at).
+# After _MAX_FREE_ATTEMPTS failures the user must wait min(2**n, 60) seconds
+# between attempts; blocked attempts touch neither the DB nor bcrypt.
+# Counters idle for _ATTEMPTS_TTL are forgotten and at most _ATTEMPTS_MAX are
+# kept, so a flood of distinct usernames can't grow the table without bound.
+_MAX_FREE_ATTEMPTS = 5
+_MAX_BACKOFF = 60.0  # seconds
+_ATTEMPTS_TTL = 600.0  # seconds
+_ATTEMPTS_MAX = 1024
+_ATTEMPTS: "OrderedDict[str, tuple[int, float]]" = OrderedDict()
+_ATTEMPTS_LOCK = threading.Lock()
+
+
+def _purge_attempts(now: float) -> None:
+    """Drop idle counters (caller holds _ATTEMPTS_LOCK)"""
+    # Entries are in last-failure order, so expired ones are at the front
+    while _ATTEMPTS and now - next(iter(_ATTEMPTS.values()))[1] >= _ATTEMPTS_TTL:
+        _ATTEMPTS.popitem(last=False)
+
+
+def _is_throttled(username: str) -> bool:
+    """True if username is still inside its backoff window"""
+    now = time.monotonic()
+    with _ATTEMPTS_LOCK:
+        _purge_attempts(now)
+        entry = _ATTEMPTS.get(username)
+    if entry is None:
+        return False
+    failures, last_failure = entry
+    return (failures >= _MAX_FREE_ATTEMPTS
+            and now - last_failure < min(2 ** failures, _MAX_BACKOFF))
+
+
+def _record_failure(username: str) -> None:
+    """Count a failed attempt for username"""
+    now = time.monotonic()
+    with _ATTEMPTS_LOCK:
+        _purge_attempts(now)
+        failures, _ = _ATTEMPTS.pop(username, (0, 0.0))
+        _ATTEMPTS[username] = (failures + 1, now)
+        if len(_ATTEMPTS) > _ATTEMPTS_MAX:
+            _ATTEMPTS.popitem(last=False)
+
+
+def _clear_failures(username: str) -> None:
+    """Reset the counter after a successful login"""
+    with _ATTEMPTS_LOCK:
+        _ATTEMPTS.pop(username, None)
+
 
 class LoginScreen(Screen):
     """
@@ -75,35 +158,52 @@ class LoginScreen(Screen):
         margin-top: 2;
     }
     """
+
+    # True while credentials are being validated; watch_is_loading paints
+    # the status line once per transition
+    is_loading: reactive[bool] = reactive(False, init=False)
+
+    # Static copy, defined once for every LoginScreen instance. Widgets can't
+    # be shared between mounts, so only their text lives at class level.
+    _TITLE_LABEL_TEXT = "🏥 SISTEMA MÉDICO"
+    _USERNAME_LABEL_TEXT = "Usuario:"
+    _USERNAME_PLACEHOLDER = "Ingrese su usuario"
+    _PASSWORD_LABEL_TEXT = "Contraseña:"
+    _PASSWORD_PLACEHOLDER = "Ingrese su contraseña"
+    _LOGIN_BUTTON_TEXT = "Ingresar"
+    _EXIT_BUTTON_TEXT = "Salir"
     
     def __init__(self, flask_app, bully_manager):
         super().__init__()
         self.flask_app = flask_app
         self.bully_manager = bully_manager
+
+        # Status shown when loading finishes ("" on success, error otherwise)
+        self._status_text = ""
     
     def compose(self) -> ComposeResult:
         """Compose the login screen"""
         with Center():
             with Container(id="login-container"):
-                yield Label("🏥 SISTEMA MÉDICO", id="login-title")
+                yield Label(self._TITLE_LABEL_TEXT, id="login-title")
                 
-                yield Label("Usuario:", classes="input-label")
-                yield Input(placeholder="Ingrese su usuario", id="username-input")
+                yield Label(self._USERNAME_LABEL_TEXT, classes="input-label")
+                yield Input(placeholder=self._USERNAME_PLACEHOLDER, id="username-input")
                 
-                yield Label("Contraseña:", classes="input-label")
+                yield Label(self._PASSWORD_LABEL_TEXT, classes="input-label")
                 yield Input(
-                    placeholder="Ingrese su contraseña",
+                    placeholder=self._PASSWORD_PLACEHOLDER,
                     password=True,
                     id="password-input"
                 )
                 
                 with Horizontal(id="button-container"):
-                    yield Button("Ingresar", variant="primary", id="login-button")
-                    yield Button("Salir", variant="error", id="exit-button")
+                    yield Button(self._LOGIN_BUTTON_TEXT, variant="primary", id="login-button")
+                    yield Button(self._EXIT_BUTTON_TEXT, variant="error", id="exit-button")
                 
                 yield Static("", id="status-message")
                 
-                # Node info
+                # Node info (live bully state, built on every compose)
                 node_id = self.bully_manager.node_id
                 state = self.bully_manager.state.value
                 cluster_size = len(self.bully_manager.cluster_nodes) + 1
@@ -136,24 +236,28 @@ class LoginScreen(Screen):
             status.update("[red]⚠ Por favor ingrese usuario y contraseña[/red]")
             return
 
-        status.update("[yellow]⏳ Validando credenciales...[/yellow]")
+        self._status_text = ""
+        self.is_loading = True
+        try:
+            # Authenticate off the UI thread
+            result = await self._validate_credentials(username, password)
 
-        # Authenticate in thread pool to avoid blocking UI
-        result = await asyncio.to_thread(
-            self._validate_credentials,
-            username,
-            password
-        )
+            if result['success']:
+                user_info = result['user_info']
+                # Use nombre if available, otherwise use username
+                display_name = user_info.get('nombre', user_info.get('username', 'Usuario'))
+                self.notify(
+                    f"✓ Bienvenido, {display_name}! ({user_info['rol_display']})",
+                    timeout=0.5
+                )
+            else:
+                self._status_text = f"[red]❌ {result['error']}[/red]"
+                # Clear password field on error
+                password_input.value = ""
+        finally:
+            self.is_loading = False
 
         if result['success']:
-            user_info = result['user_info']
-            # Use nombre if available, otherwise use username
-            display_name = user_info.get('nombre', user_info.get('username', 'Usuario'))
-            status.update(f"[green]✓ Bienvenido, {display_name}! ({user_info['rol_display']})[/green]")
-
-            # Small delay to show success message
-            await asyncio.sleep(0.5)
-
             # Navigate to main Visitas screen
             from .visitas import VisitasScreen
             self.app.push_screen(
@@ -164,14 +268,21 @@ class LoginScreen(Screen):
                     user_info=user_info
                 )
             )
-        else:
-            status.update(f"[red]❌ {result['error']}[/red]")
-            # Clear password field on error
-            password_input.value = ""
 
-    def _validate_credentials(self, username: str, password: str) -> dict:
+    def watch_is_loading(self, loading: bool) -> None:
+        """Single status-line update per loading transition"""
+        status = self.query_one("#status-message", Static)
+        status.update(
+            "[yellow]⏳ Validando credenciales...[/yellow]" if loading else self._status_text
+        )
+
+    async def _validate_credentials(self, username: str, password: str) -> dict:
         """
-        Validate user credentials against database (runs in thread pool)
+        Validate user credentials against database
+
+        The user row is fetched on the DB executor; the bcrypt check then runs
+        on a plain worker thread, outside the app context and session. The
+        extended user info is only loaded once the password checks out.
 
         Returns:
             dict: {
@@ -180,55 +291,104 @@ class LoginScreen(Screen):
                 'error': str or None
             }
         """
-        with self.flask_app.app_context():
-            from models import Usuario
-            from auth import get_user_info
-
-            try:
-                # Query user from database
-                user = Usuario.query.filter_by(username=username).first()
-
-                if not user:
-                    return {
-                        'success': False,
-                        'error': 'Usuario no encontrado'
-                    }
-
-                # Check if user is active
-                if not user.activo:
-                    return {
-                        'success': False,
-                        'error': 'Usuario inactivo. Contacte al administrador.'
-                    }
-
-                # Verify password
-                if not user.check_password(password):
-                    return {
-                        'success': False,
-                        'error': 'Contraseña incorrecta'
-                    }
-
-                # Get extended user info
-                user_info = get_user_info(user)
+        if _is_throttled(username):
+            return {
+                'success': False,
+                'error': 'Demasiados intentos. Espere un momento e intente de nuevo.'
+            }
+
+        if is_username_known_missing(username):
+            _record_failure(username)
+            return {
+                'success': False,
+                'error': 'Usuario no encontrado'
+            }
 
+        try:
+            # Query user from database
+            user = await run_db(self._fetch_user, username)
+
+            if not user:
+                remember_missing_username(username)
+                _record_failure(username)
+                return {
+                    'success': False,
+                    'error': 'Usuario no encontrado'
+                }
+
+            # Check if user is active
+            if not user.activo:
                 return {
-                    'success': True,
-                    'user_info': user_info,
-                    'error': None
+                    'success': False,
+                    'error': 'Usuario inactivo. Contacte al administrador.'
                 }
 
-            except Exception as e:
+            # Verify password
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, self._verify, password, user.pw_hash):
+                _record_failure(username)
                 return {
                     'success': False,
-                    'error': f'Error de autenticación: {str(e)}'
+                    'error': 'Contraseña incorrecta'
                 }
 
+            _clear_failures(username)
+
+            user_info = await run_db(self._fetch_user_info, user.id)
+
+            return {
+                'success': True,
+                'user_info': user_info,
+                'error': None
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Error de autenticación: {str(e)}'
+            }
+
+    @staticmethod
+    def _fetch_user(username: str) -> Optional[UserRow]:
+        """Load the user row (runs on the DB executor)"""
+        user = db.session.execute(_USER_STMT, {"u": username}).one_or_none()
+        if not user:
+            return None
+
+        return UserRow(
+            id=user.id,
+            activo=bool(user.activo),
+            pw_hash=user.password_hash,
+        )
+
+    @staticmethod
+    def _fetch_user_info(user_id: int) -> Optional[Dict[str, Any]]:
+        """Load the extended info of an authenticated user (runs on the DB executor)"""
+        return get_user_info(db.session.get(Usuario, user_id))
+
+    @staticmethod
+    def _verify(password: str, pw_hash: str) -> bool:
+        """bcrypt password check (CPU-bound, no DB access)"""
+        return bcrypt.checkpw(password.encode('utf-8'), pw_hash.encode('utf-8'))
+
 
 class PlaceholderDashboard(Screen):
     """
     Temporary dashboard placeholder
     Will be replaced with real dashboard in FASE 4
     """
+
+    # Whole dashboard as one markup string, parsed once per compose
+    _TEMPLATE = (
+        "\n\n"
+        "    [bold green]✓ Sesión iniciada: {username}[/]\n\n"
+        "    [cyan]Nodo: {node_id}[/]\n"
+        "    [yellow]Estado: {state}[/]\n"
+        "    [blue]Cluster: {cluster_size} nodos[/]\n\n"
+        "    [bold magenta]🚧 Dashboard en construcción[/]\n"
+        "    [dim]Próximamente: FASE 4-12[/]\n\n"
+        "    [dim italic]Presiona Ctrl+C para salir[/]"
+    )
     
     def __init__(self, flask_app, bully_manager, username):
         super().__init__()
@@ -238,17 +398,12 @@ class PlaceholderDashboard(Screen):
     
     def compose(self) -> ComposeResult:
         """Compose placeholder dashboard"""
-        message = Text()
-        message.append("\n\n")
-        message.append(f"    ✓ Sesión iniciada: {self.username}\n\n", style="bold green")
-        message.append(f"    Nodo: {self.bully_manager.node_id}\n", style="cyan")
-        message.append(f"    Estado: {self.bully_manager.state.value}\n", style="yellow")
-        message.append(f"    Cluster: {len(self.bully_manager.cluster_nodes) + 1} nodos\n\n", style="blue")
-        message.append("    🚧 Dashboard en construcción\n", style="bold magenta")
-        message.append("    Próximamente: FASE 4-12\n\n", style="dim")
-        message.append("    Presiona Ctrl+C para salir", style="dim italic")
-        
-        from rich.align import Align
+        message = Text.from_markup(self._TEMPLATE.format(
+            username=escape(self.username),
+            node_id=self.bully_manager.node_id,
+            state=self.bully_manager.state.value,
+            cluster_size=len(self.bully_manager.cluster_nodes) + 1,
+        ))
         yield Static(Align.center(message))
 
 
@@ -2,10 +2,11 @@
 Simple Create Visit Screen - Simplified version for creating emergency visits
 """
 
-import asyncio
-from typing import Dict, Any
-from datetime import datetime
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
+from sqlalchemy import insert, update
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
 from textual.widgets import Static, Input, Button, Label, Select
@@ -13,6 +14,16 @@ from textual.containers import Container, Vertical, Horizontal
 from textual import work
 from textual.binding import Binding
 
+from models import (
+    db, Cama, Doctor, VisitaEmergencia,
+    build_folio, get_primer_doctor_y_cama, upsert_paciente
+)
+from ..utils import run_db
+
+
+# Presses of "Crear Visita" closer together than this are ignored
+_SUBMIT_DEBOUNCE = 0.3  # seconds
+
 
 class SimpleCreateVisitScreen(ModalScreen):
     """Simplified screen for creating emergency visits"""
@@ -21,64 +32,7 @@ class SimpleCreateVisitScreen(ModalScreen):
         Binding("escape", "dismiss", "Cancelar", show=True),
     ]
 
-    CSS = """
-    SimpleCreateVisitScreen {
-        align: center middle;
-    }
-
-    #visit-container {
-        width: 90;
-        height: auto;
-        background: $surface;
-        border: thick $primary;
-        padding: 2;
-    }
-
-    #visit-title {
-        text-style: bold;
-        color: $primary;
-        text-align: center;
-        padding-bottom: 1;
-        border-bottom: solid $border;
-        margin-bottom: 1;
-    }
-
-    .form-label {
-        color: $text-secondary;
-        padding: 1 0 0 0;
-    }
-
-    /* NOTE: Textual CSS doesn't support ::after pseudo-elements
-     * Required fields should have asterisk in label text directly */
-    .form-label-required {
-        color: $error;
-    }
-
-    Input {
-        margin: 0 0 1 0;
-    }
-
-    Select {
-        margin: 0 0 1 0;
-    }
-
-    #button-container {
-        align: center middle;
-        margin-top: 2;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-
-    #error-message {
-        color: $error;
-        text-style: bold;
-        text-align: center;
-        margin: 1 0;
-        min-height: 1;
-    }
-    """
+    CSS_PATH = "simple_create_visit.tcss"
 
     def __init__(self, flask_app, bully_manager, username: str):
         super().__init__()
@@ -86,6 +40,9 @@ class SimpleCreateVisitScreen(ModalScreen):
         self.bully_manager = bully_manager
         self.username = username
 
+        # Last accepted "Crear Visita" press (monotonic), for debouncing
+        self._last_submit = 0.0
+
     def compose(self) -> ComposeResult:
         """Compose the create visit form"""
         with Container(id="visit-container"):
@@ -124,9 +81,51 @@ class SimpleCreateVisitScreen(ModalScreen):
                 yield Button("✓ Crear Visita", variant="success", id="btn-create")
                 yield Button("Cancelar", variant="error", id="btn-cancel")
 
+    def on_mount(self) -> None:
+        """Cache the form widgets so submits don't walk the DOM"""
+        self._inp_nombre = self.query_one("#input-nombre", Input)
+        self._inp_edad = self.query_one("#input-edad", Input)
+        self._sel_sexo = self.query_one("#select-sexo", Select)
+        self._inp_curp = self.query_one("#input-curp", Input)
+        self._inp_sintomas = self.query_one("#input-sintomas", Input)
+        self._error = self.query_one("#error-message", Static)
+        self._btn_create = self.query_one("#btn-create", Button)
+
+    @staticmethod
+    def _validate(values: Mapping[str, Any]) -> Tuple[bool, str]:
+        """Check the form snapshot -> (ok, error message)"""
+        if not values['nombre']:
+            return False, "❌ El nombre es requerido"
+
+        edad = values['edad']
+        if not edad:
+            return False, "❌ La edad es requerida"
+        try:
+            if not 0 <= int(edad) <= 150:
+                return False, "❌ Edad inválida (0-150)"
+        except ValueError:
+            return False, "❌ La edad debe ser un número"
+
+        if not values['sexo']:
+            return False, "❌ El sexo es requerido"
+
+        sintomas = values['sintomas']
+        if not sintomas:
+            return False, "❌ Los síntomas son requeridos"
+        if len(sintomas) < 10:
+            return False, "❌ Describa los síntomas con más detalle"
+
+        return True, ""
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
         if event.button.id == "btn-create":
+            # Drop double-clicks: a second press would cancel the running
+            # worker and validate/submit again
+            now = time.monotonic()
+            if now - self._last_submit < _SUBMIT_DEBOUNCE:
+                return
+            self._last_submit = now
             self.create_visit()
         elif event.button.id == "btn-cancel":
             self.dismiss(None)
@@ -134,64 +133,49 @@ class SimpleCreateVisitScreen(ModalScreen):
     @work(exclusive=True)
     async def create_visit(self) -> None:
         """Create the emergency visit"""
-        # Get form values
-        nombre = self.query_one("#input-nombre", Input).value.strip()
-        edad = self.query_one("#input-edad", Input).value.strip()
-        sexo = self.query_one("#select-sexo", Select).value
-        curp = self.query_one("#input-curp", Input).value.strip()
-        sintomas = self.query_one("#input-sintomas", Input).value.strip()
-
-        error_widget = self.query_one("#error-message", Static)
-
-        # Validate
-        if not nombre:
-            error_widget.update("❌ El nombre es requerido")
-            return
-
-        if not edad:
-            error_widget.update("❌ La edad es requerida")
-            return
-
-        try:
-            edad_int = int(edad)
-            if edad_int < 0 or edad_int > 150:
-                error_widget.update("❌ Edad inválida (0-150)")
-                return
-        except ValueError:
-            error_widget.update("❌ La edad debe ser un número")
-            return
-
-        if not sexo:
-            error_widget.update("❌ El sexo es requerido")
-            return
-
-        if not sintomas:
-            error_widget.update("❌ Los síntomas son requeridos")
-            return
-
-        if len(sintomas) < 10:
-            error_widget.update("❌ Describa los síntomas con más detalle")
+        # Read every field in one pass into a read-only snapshot
+        values = MappingProxyType({
+            'nombre': self._inp_nombre.value.strip(),
+            'edad': self._inp_edad.value.strip(),
+            'sexo': self._sel_sexo.value,
+            'curp': self._inp_curp.value.strip(),
+            'sintomas': self._inp_sintomas.value.strip(),
+        })
+
+        error_widget = self._error
+
+        ok, error = self._validate(values)
+        if not ok:
+            error_widget.update(error)
             return
 
         error_widget.update("")
 
-        # Create visit
+        # Create visit. The button stays disabled until the insert returns:
+        # cancelling this worker wouldn't stop the DB thread, so a retry
+        # could insert the visit twice
         self.notify("⏳ Creando visita...", severity="information")
+        create_btn = self._btn_create
+        create_btn.disabled = True
 
         try:
-            result = await asyncio.to_thread(
+            result = await run_db(
                 self._create_visit_in_db,
-                nombre, edad_int, sexo, curp, sintomas
+                values['nombre'], int(values['edad']), values['sexo'],
+                values['curp'], values['sintomas']
             )
 
             if result['success']:
                 self.dismiss(result)
+                return
             else:
                 error_widget.update(f"❌ {result['error']}")
 
         except Exception as e:
             error_widget.update(f"❌ Error: {str(e)}")
 
+        create_btn.disabled = False
+
     def _create_visit_in_db(
         self,
         nombre: str,
@@ -200,72 +184,81 @@ class SimpleCreateVisitScreen(ModalScreen):
         curp: str,
         sintomas: str
     ) -> Dict[str, Any]:
-        """Create visit in database"""
-        with self.flask_app.app_context():
-            from models import (
-                db, VisitaEmergencia, Paciente,
-                get_doctores_disponibles, get_camas_disponibles
-            )
+        """Create visit in database (runs on the DB executor)"""
+        id_sala = self.bully_manager.node_id
 
-            try:
-                # 1. Get available resources
-                doctores = get_doctores_disponibles(id_sala=self.bully_manager.node_id)
-                camas = get_camas_disponibles(id_sala=self.bully_manager.node_id)
+        try:
+            # One explicit transaction: commits on exit, rolls back on error.
+            # Concurrent admissions may read the same free doctor and bed
+            # (SQLite has no row locks), so step 4 takes them conditionally
+            with db.session.begin():
+                # 1. Reserve first available doctor and bed
+                doctor, cama = get_primer_doctor_y_cama(
+                    id_sala=id_sala, for_update=True
+                )
 
-                if not doctores:
+                if not doctor:
                     return {'success': False, 'error': 'No hay doctores disponibles'}
 
-                if not camas:
+                if not cama:
                     return {'success': False, 'error': 'No hay camas disponibles'}
 
                 # Auto-assign first available
-                doctor = doctores[0]
-                cama = camas[0]
-
-                # 2. Create or find patient
-                paciente = None
-                if curp:
-                    paciente = Paciente.query.filter_by(curp=curp).first()
-
-                if not paciente:
-                    paciente = Paciente(
-                        nombre=nombre,
-                        edad=edad,
-                        sexo=sexo,
-                        curp=curp if curp else None,
-                        activo=1
+                id_doctor, doctor_nombre = doctor
+                id_cama, cama_numero = cama
+
+                # 2. Find or create patient in one statement; ON CONFLICT
+                # (curp) closes the race between two admissions of the same
+                # CURP that a SELECT-then-INSERT leaves open
+                id_paciente = upsert_paciente(nombre, edad, sexo, curp=curp or None)
+
+                # 3. Create visit. RETURNING hands back the keys without a
+                # refresh() SELECT; Core inserts skip the before_insert event,
+                # so the folio is built here
+                folio, id_visita = db.session.execute(
+                    insert(VisitaEmergencia)
+                    .values(
+                        folio=build_folio(id_paciente, id_doctor, id_sala),
+                        id_paciente=id_paciente,
+                        id_doctor=id_doctor,
+                        id_cama=id_cama,
+                        id_trabajador=1,  # TODO: Get from session
+                        id_sala=id_sala,
+                        sintomas=sintomas,
+                        estado='activa'
+                    )
+                    .returning(VisitaEmergencia.folio, VisitaEmergencia.id_visita)
+                ).one()
+
+                # 4. Take the resources (same as the console flow). Only the
+                # first admission to get here matches; a loser raises so the
+                # whole transaction, visit included, is rolled back
+                cama_tomada = db.session.execute(
+                    update(Cama)
+                    .where(Cama.id_cama == id_cama, Cama.ocupada == False)
+                    .values(ocupada=True, id_paciente=id_paciente)
+                ).rowcount
+                doctor_tomado = db.session.execute(
+                    update(Doctor)
+                    .where(Doctor.id_doctor == id_doctor, Doctor.disponible == True)
+                    .values(disponible=False)
+                ).rowcount
+                if cama_tomada != 1 or doctor_tomado != 1:
+                    raise ValueError(
+                        'El doctor o la cama acaban de ser asignados a otra visita, intente de nuevo'
                     )
-                    db.session.add(paciente)
-                    db.session.flush()
-
-                # 3. Create visit
-                visita = VisitaEmergencia(
-                    id_paciente=paciente.id_paciente,
-                    id_doctor=doctor.id_doctor,
-                    id_cama=cama.id_cama,
-                    id_trabajador=1,  # TODO: Get from session
-                    id_sala=self.bully_manager.node_id,
-                    sintomas=sintomas,
-                    estado='activa',
-                    timestamp=datetime.utcnow()
-                )
-
-                db.session.add(visita)
-                db.session.commit()
-
-                db.session.refresh(visita)
 
-                return {
-                    'success': True,
-                    'folio': visita.folio,
-                    'id_visita': visita.id_visita,
-                    'doctor': doctor.nombre,
-                    'cama': cama.numero
-                }
+            return {
+                'success': True,
+                'folio': folio,
+                'id_visita': id_visita,
+                'doctor': doctor_nombre,
+                'cama': cama_numero
+            }
 
-            except Exception as e:
-                db.session.rollback()
-                return {'success': False, 'error': str(e)}
+        except Exception as e:
+            db.session.rollback()
+            return {'success': False, 'error': str(e)}
 
 
 # Export
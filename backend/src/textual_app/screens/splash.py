@@ -12,6 +12,13 @@ from rich.align import Align
 from rich.panel import Panel
 import asyncio
 import time
+from pathlib import Path
+from typing import Awaitable, Callable, Tuple
+
+from sqlalchemy import text as sql_text
+
+from models import db
+from ..utils import run_db
 
 
 # Hospital Logo ASCII Art
@@ -36,142 +43,221 @@ MEDICAL_CROSS = """
                               ███████
 """
 
+# Art and static copy as ready-made Text, built once at import. Static
+# widgets would otherwise re-parse the strings as markup on every mount.
+_LOGO_TEXT = Text(HOSPITAL_LOGO)
+_CROSS_TEXT = Text(MEDICAL_CROSS)
+
+
+def _build_simple_header() -> Text:
+    """Fixed top part of SimpleSplashScreen"""
+    header = Text()
+    header.append("\n\n")
+    header.append("    🏥 HOSPITAL\n", style="bold red")
+    header.append("    ═══════════\n\n", style="bold white")
+    header.append("    Sistema Médico Distribuido v2.0\n", style="bold cyan")
+    header.append("    Emergency Management System\n\n", style="dim")
+    return header
+
+
+_SIMPLE_HEADER = _build_simple_header()
+
+# Longest the splash waits for the Bully election to produce a leader
+_CLUSTER_WAIT = 3.0  # seconds
+# Spinner shown next to checks that are still running
+_SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+_SPINNER_INTERVAL = 0.08  # seconds
+# How long the final summary stays up before moving on to login
+_FINAL_HOLD = 1.0  # seconds
+
+# Status pieces that never change, styled up front (no markup to parse)
+_NEWLINE = Text("\n")
+_READY_TEXT = Text("✓ Sistema listo\n", style="bold green")
+
+_PING = sql_text("SELECT 1")
+
+# Written after every fully healthy startup; a restart of the same node
+# shortly after one skips the checks (warm restart). One marker per node id:
+# several nodes run on one host, each with its own DB
+_HEALTHY_MARKER_DIR = Path.home() / ".cache" / "hospital"
+_WARM_WINDOW = 60.0  # seconds
+
+
+def _healthy_marker(node_id: int) -> Path:
+    return _HEALTHY_MARKER_DIR / f"last_healthy_{node_id}"
+
+
+def _recently_healthy(node_id: int) -> bool:
+    """True if node_id's last fully healthy startup was under _WARM_WINDOW ago"""
+    try:
+        return time.time() - _healthy_marker(node_id).stat().st_mtime < _WARM_WINDOW
+    except OSError:
+        return False
+
+
+def _mark_healthy(node_id: int) -> None:
+    """Touch node_id's warm-restart marker; a read-only home just means no warm boot"""
+    try:
+        _HEALTHY_MARKER_DIR.mkdir(parents=True, exist_ok=True)
+        _healthy_marker(node_id).write_text(str(time.time()))
+    except OSError:
+        pass
+
+
+def _ping_database() -> None:
+    """Cheapest possible query (runs on the DB executor)"""
+    db.session.execute(_PING)
+
+
+async def _run_check(name: str, check: Callable[[], Awaitable[str]]) -> Tuple[str, bool, str]:
+    """Run one startup check -> (name, ok, detail); failures don't abort startup"""
+    try:
+        return name, True, await check()
+    except Exception as e:
+        return name, False, str(e)
+
 
 class SplashScreen(Screen):
     """
     Animated splash screen with system initialization checks
     """
     
-    CSS = """
-    SplashScreen {
-        align: center middle;
-        background: $surface;
-    }
-    
-    #splash-container {
-        width: 100%;
-        height: 100%;
-        align: center middle;
-    }
-    
-    #logo-container {
-        width: auto;
-        height: auto;
-        content-align: center middle;
-        padding: 2;
-    }
-    
-    #logo {
-        color: $primary;
-        text-style: bold;
-        content-align: center middle;
-    }
-    
-    #medical-cross {
-        color: $error;
-        content-align: center middle;
-    }
-    
-    #title {
-        color: $accent;
-        text-style: bold;
-        content-align: center middle;
-        margin-top: 1;
-    }
-    
-    #subtitle {
-        color: $text-muted;
-        text-style: italic;
-        content-align: center middle;
-    }
-    
-    #status {
-        color: $success;
-        content-align: center middle;
-        margin-top: 2;
-        min-height: 3;
-    }
-    
-    #version {
-        color: $text-muted;
-        text-style: dim;
-        content-align: center middle;
-        margin-top: 1;
-    }
-    """
+    CSS_PATH = "splash.tcss"
     
     def __init__(self, flask_app, bully_manager):
         super().__init__()
         self.flask_app = flask_app
         self.bully_manager = bully_manager
         self.checks_complete = False
+        self._status = None
+        self._lines = {}
+        self._frame = 0
     
     def compose(self) -> ComposeResult:
         """Compose the splash screen layout"""
         with Container(id="splash-container"):
             with Vertical(id="logo-container"):
-                yield Static(MEDICAL_CROSS, id="medical-cross")
-                yield Static(HOSPITAL_LOGO, id="logo")
+                yield Static(_CROSS_TEXT, id="medical-cross")
+                yield Static(_LOGO_TEXT, id="logo")
                 yield Label("SISTEMA MÉDICO DISTRIBUIDO", id="title")
                 yield Label("Emergency Management & Distributed Consensus", id="subtitle")
-                yield Static("", id="status")
+                yield Static("", id="status", markup=False)
                 yield Label("v2.0.0 - Powered by Textual", id="version")
     
     def on_mount(self) -> None:
         """Called when screen is mounted - start animations"""
+        if _recently_healthy(self.bully_manager.node_id):
+            # Warm restart: everything checked out moments ago
+            self.checks_complete = True
+            self.app.push_screen("login")
+            return
         self.run_startup_sequence()
     
     @work(exclusive=True)
     async def run_startup_sequence(self):
         """
-        Run animated startup sequence with system checks
+        Run the startup checks concurrently and report each one as it finishes
         Runs as async worker
         """
-        status_widget = self.query_one("#status", Static)
-        
-        # Animation sequence
-        checks = [
-            ("Iniciando sistema", 0.3),
-            ("Verificando base de datos", 0.5),
-            ("Conectando al cluster Bully", 0.7),
-            ("Descubriendo nodos en la red", 0.8),
-            ("Cargando configuración", 0.4),
-            ("Inicializando interfaz", 0.5),
-        ]
-        
-        for message, delay in checks:
-            # Show spinner with message
-            for i in range(3):
-                spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"][i % 10]
-                status_widget.update(f"{spinner} {message}...")
-                await asyncio.sleep(0.1)
-            
-            # Simulate work
-            await asyncio.sleep(delay)
-            
-            # Show success
-            status_widget.update(f"✓ {message}")
-            await asyncio.sleep(0.2)
-        
+        status_widget = self._status = self.query_one("#status", Static)
+
+        checks = (
+            ("Base de datos", self._check_database),
+            ("Cluster Bully", self._check_cluster),
+            ("Nodos en la red", self._check_nodes),
+        )
+
+        # None = still running; drawn with the current spinner frame
+        self._lines = {name: None for name, _ in checks}
+        self._render_status()
+        spinner = self.set_interval(_SPINNER_INTERVAL, self._tick_spinner)
+
+        all_ok = True
+        try:
+            for finished in asyncio.as_completed([_run_check(name, check) for name, check in checks]):
+                name, ok, detail = await finished
+                all_ok = all_ok and ok
+                self._lines[name] = Text(
+                    f"{'✓' if ok else '✗'} {name}: {detail}",
+                    style="green" if ok else "red"
+                )
+                self._render_status()
+        finally:
+            spinner.stop()
+
+        if all_ok:
+            _mark_healthy(self.bully_manager.node_id)
+
         # Final message
-        node_id = self.bully_manager.node_id
-        state = self.bully_manager.state
-        cluster_size = len(self.bully_manager.cluster_nodes) + 1  # +1 for self
+        bully = self.bully_manager
+        node_id = bully.node_id
+        state_value = bully.state.value
+        cluster_size = len(bully.cluster_nodes) + 1  # +1 for self
         
-        final_msg = Text()
-        final_msg.append("✓ Sistema listo\n", style="bold green")
+        final_msg = _READY_TEXT.copy()
         final_msg.append(f"Nodo {node_id} | ", style="cyan")
-        final_msg.append(f"{state.value.upper()} | ", style="yellow" if state.value == "follower" else "magenta")
+        final_msg.append(f"{state_value.upper()} | ", style="yellow" if state_value == "follower" else "magenta")
         final_msg.append(f"{cluster_size} nodo(s) detectado(s)", style="blue")
         
         status_widget.update(final_msg)
-        await asyncio.sleep(1.5)
+        # Short hold so the summary can be read
+        await asyncio.sleep(_FINAL_HOLD)
         
         self.checks_complete = True
         
         # Transition to login screen
         self.app.push_screen("login")
 
+    def _tick_spinner(self) -> None:
+        """Advance the spinner one frame (timer callback)"""
+        self._frame = (self._frame + 1) % len(_SPINNER_FRAMES)
+        self._render_status()
+
+    def _render_status(self) -> None:
+        """Draw one line per check; pending ones get the spinner"""
+        frame = _SPINNER_FRAMES[self._frame]
+        self._status.update(_NEWLINE.join(
+            line if line is not None else Text(f"{frame} {name}...")
+            for name, line in self._lines.items()
+        ))
+
+    async def _check_database(self) -> str:
+        """Round trip to the local database"""
+        await run_db(_ping_database)
+        return "OK"
+
+    async def _check_cluster(self) -> str:
+        """Wait (at most _CLUSTER_WAIT seconds) for the election to settle on a leader"""
+        bully = self.bully_manager
+        if bully.get_current_leader() is None:
+            loop = asyncio.get_running_loop()
+            changed = asyncio.Event()
+
+            def on_change() -> None:
+                # Called from Bully's network threads
+                loop.call_soon_threadsafe(changed.set)
+
+            bully.add_state_listener(on_change)
+            try:
+                deadline = loop.time() + _CLUSTER_WAIT
+                while bully.get_current_leader() is None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return "sin líder todavía"
+                    changed.clear()
+                    try:
+                        await asyncio.wait_for(changed.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                bully.remove_state_listener(on_change)
+
+        return f"líder Nodo {bully.get_current_leader()}"
+
+    async def _check_nodes(self) -> str:
+        """Nodes currently known to this one"""
+        return f"{len(self.bully_manager.cluster_nodes) + 1} conocido(s)"
+
 
 class SimpleSplashScreen(Screen):
     """
@@ -186,14 +272,11 @@ class SimpleSplashScreen(Screen):
     
     def compose(self) -> ComposeResult:
         """Compose simple splash"""
-        content = Text()
-        content.append("\n\n")
-        content.append("    🏥 HOSPITAL\n", style="bold red")
-        content.append("    ═══════════\n\n", style="bold white")
-        content.append("    Sistema Médico Distribuido v2.0\n", style="bold cyan")
-        content.append("    Emergency Management System\n\n", style="dim")
-        content.append(f"    Nodo {self.bully_manager.node_id} | ", style="green")
-        content.append(f"{self.bully_manager.state.value}\n\n", style="yellow")
+        # Copy the prebuilt header so the shared one is never mutated
+        bully = self.bully_manager
+        content = _SIMPLE_HEADER.copy()
+        content.append(f"    Nodo {bully.node_id} | ", style="green")
+        content.append(f"{bully.state.value}\n\n", style="yellow")
         content.append("    Cargando", style="dim")
         
         yield Static(Align.center(content))
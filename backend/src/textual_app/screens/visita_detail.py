@@ -3,6 +3,7 @@ Visit Detail Modal - Shows detailed information about a visit
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 from textual.app import ComposeResult
@@ -14,6 +15,29 @@ from rich.text import Text
 from rich.panel import Panel
 
 
+# Badge classes per known estado; anything else gets the plain badge
+_ESTADO_CLASSES = {
+    estado: f"estado-badge estado-{estado}"
+    for estado in ("activa", "completada", "cancelada")
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(ts: str) -> datetime:
+    """Parse an ISO timestamp, accepting a trailing 'Z' (pre-3.11 fromisoformat doesn't)"""
+    return datetime.fromisoformat(ts[:-1] + "+00:00" if ts.endswith("Z") else ts)
+
+
+def _format_timestamp(value: Any) -> str:
+    """dd/mm/YYYY HH:MM:SS for ISO strings; anything unparseable is shown as-is"""
+    if not isinstance(value, str):
+        return str(value)
+    try:
+        return _parse_iso(value).strftime('%d/%m/%Y %H:%M:%S')
+    except ValueError:
+        return value
+
+
 class VisitDetailModal(ModalScreen):
     """Modal screen to show detailed visit information"""
 
@@ -21,92 +45,7 @@ class VisitDetailModal(ModalScreen):
         Binding("escape", "dismiss", "Cerrar", show=True),
     ]
 
-    CSS = """
-    VisitDetailModal {
-        align: center middle;
-    }
-
-    #detail-container {
-        width: 80;
-        height: auto;
-        max-height: 90%;
-        background: $surface;
-        border: thick $primary;
-        padding: 2;
-    }
-
-    #detail-title {
-        text-style: bold;
-        color: $primary;
-        text-align: center;
-        padding-bottom: 1;
-        border-bottom: solid $border;
-        margin-bottom: 1;
-    }
-
-    .detail-section {
-        margin: 1 0;
-        padding: 1;
-        background: $panel;
-        border: solid $border;
-    }
-
-    .section-title {
-        text-style: bold;
-        color: $primary;
-        margin-bottom: 1;
-    }
-
-    .field-label {
-        color: $text-secondary;
-        width: 20;
-    }
-
-    .field-value {
-        color: $text-primary;
-        text-style: bold;
-    }
-
-    .field-row {
-        height: auto;
-        margin: 0 0 1 0;
-    }
-
-    #button-container {
-        align: center middle;
-        margin-top: 2;
-    }
-
-    #close-btn {
-        margin: 0 1;
-    }
-
-    #cerrar-visita-btn {
-        margin: 0 1;
-    }
-
-    .estado-badge {
-        padding: 0 2;
-        text-align: center;
-    }
-
-    .estado-activa {
-        background: $success;
-        color: $surface;
-        text-style: bold;
-    }
-
-    .estado-completada {
-        background: $text-muted;
-        color: $surface;
-    }
-
-    .estado-cancelada {
-        background: $error;
-        color: $surface;
-        text-style: bold;
-    }
-    """
+    CSS_PATH = "visita_detail.tcss"
 
     def __init__(self, visita: Dict[str, Any], flask_app, username: str):
         super().__init__()
@@ -157,7 +96,7 @@ class VisitDetailModal(ModalScreen):
 
                 # Estado with color badge
                 estado = self.visita.get('estado', 'desconocido')
-                estado_classes = f"estado-badge estado-{estado}"
+                estado_classes = _ESTADO_CLASSES.get(estado, "estado-badge")
 
                 with Horizontal(classes="field-row"):
                     yield Label("Estado:", classes="field-label")
@@ -165,14 +104,7 @@ class VisitDetailModal(ModalScreen):
 
                 # Timestamps
                 timestamp = self.visita.get('timestamp', '')
-                if timestamp:
-                    try:
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        timestamp_formatted = dt.strftime('%d/%m/%Y %H:%M:%S')
-                    except:
-                        timestamp_formatted = timestamp
-                else:
-                    timestamp_formatted = 'N/A'
+                timestamp_formatted = _format_timestamp(timestamp) if timestamp else 'N/A'
 
                 with Horizontal(classes="field-row"):
                     yield Label("Fecha de ingreso:", classes="field-label")
@@ -181,11 +113,7 @@ class VisitDetailModal(ModalScreen):
                 # Fecha cierre (if exists)
                 fecha_cierre = self.visita.get('fecha_cierre', '')
                 if fecha_cierre:
-                    try:
-                        dt = datetime.fromisoformat(fecha_cierre.replace('Z', '+00:00'))
-                        cierre_formatted = dt.strftime('%d/%m/%Y %H:%M:%S')
-                    except:
-                        cierre_formatted = fecha_cierre
+                    cierre_formatted = _format_timestamp(fecha_cierre)
 
                     with Horizontal(classes="field-row"):
                         yield Label("Fecha de cierre:", classes="field-label")
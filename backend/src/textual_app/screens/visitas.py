@@ -3,8 +3,10 @@ Visitas Screen - Main screen for viewing and managing emergency visits
 """
 
 import asyncio
+import re
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
 from textual.app import ComposeResult
 from textual.screen import Screen
@@ -19,10 +21,84 @@ from textual.widgets import (
     Select
 )
 from textual.containers import Container, Horizontal, Vertical
+from textual.widgets.data_table import RowKey
 from textual.reactive import reactive
 from textual import work
 from textual.binding import Binding
 from rich.text import Text
+from sqlalchemy import and_, func, or_, select
+
+from ..utils import run_db
+
+
+# DataTable columns: (header, column key)
+_COLUMNS = (
+    ("Folio", "folio"),
+    ("Paciente", "paciente"),
+    ("Doctor", "doctor"),
+    ("Sala", "sala"),
+    ("Cama", "cama"),
+    ("Estado", "estado"),
+    ("Fecha/Hora", "fecha"),
+)
+_COLUMN_KEYS = tuple(key for _, key in _COLUMNS)
+
+# Colored estado cells, built once; DataTable only reads them, so sharing is safe
+_ESTADO_TEXT = {
+    estado: Text(estado.upper(), style=style)
+    for estado, style in (
+        ('activa', 'bold green'),
+        ('completada', 'dim'),
+        ('cancelada', 'bold red'),
+    )
+}
+
+# Estado counts shown in the header, in this order
+_ESTADO_RESUMEN = (
+    ('activa', 'activas'),
+    ('completada', 'completadas'),
+    ('cancelada', 'canceladas'),
+)
+
+# Rows fetched per page; the rest are loaded on demand
+_PAGE_SIZE = 200
+
+# Pause in typing after which the search actually runs
+_SEARCH_DEBOUNCE = 0.2  # seconds
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ts: str) -> str:
+    """dd/mm HH:MM for an ISO timestamp; unparseable values are cut to 16 chars"""
+    try:
+        return datetime.fromisoformat(ts.replace('Z', '+00:00')).strftime('%d/%m %H:%M')
+    except ValueError:
+        return ts[:16]
+
+
+def _search_tokens(query: str) -> Tuple[str, ...]:
+    """Lowercase words of a search; a visita must contain all of them"""
+    return tuple(query.lower().split())
+
+
+@lru_cache(maxsize=64)
+def _search_matcher(tokens: Tuple[str, ...]) -> Callable[[str], Any]:
+    """
+    Predicate over a row's _search_blob, compiled once per search
+
+    A single word is a plain substring test; several become one regex of
+    lookaheads so each blob is scanned by re's C loop instead of once per word
+    """
+    if len(tokens) == 1:
+        word = tokens[0]
+        return lambda blob: word in blob
+    return re.compile("".join(f"(?=.*{re.escape(t)})" for t in tokens), re.DOTALL).match
+
+
+def _like_pattern(query: str) -> str:
+    """Substring LIKE pattern with the user's %, _ and \\ taken literally"""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
 
 class VisitasScreen(Screen):
@@ -35,6 +111,7 @@ class VisitasScreen(Screen):
         Binding("ctrl+r", "refresh", "Actualizar", show=True),
         Binding("ctrl+n", "new_visit", "Nueva Visita", show=True),
         Binding("ctrl+b", "show_cluster", "Cluster Bully", show=True),
+        Binding("ctrl+l", "load_more", "Cargar más", show=True),
         Binding("escape", "app.pop_screen", "Volver", show=True),
     ]
 
@@ -113,9 +190,11 @@ class VisitasScreen(Screen):
     """
 
     # Reactive state
-    visitas_data: reactive[List[Dict[str, Any]]] = reactive([], init=False)
-    search_query: reactive[str] = reactive("")
-    filter_estado: reactive[str] = reactive("todas")
+    visitas_data: reactive[List[Dict[str, Any]]] = reactive([], init=False, always_update=True)
+    # Widening a filter reloads from SQL (init=False: on_mount already does the
+    # first load)
+    search_query: reactive[str] = reactive("", init=False)
+    filter_estado: reactive[str] = reactive("todas", init=False)
     is_loading: reactive[bool] = reactive(False)
 
     def __init__(self, flask_app, bully_manager, username: str, user_info: Dict[str, Any] = None):
@@ -125,6 +204,17 @@ class VisitasScreen(Screen):
         self.username = username
         self.user_info = user_info or {}
         self.filtered_visitas: List[Dict[str, Any]] = []
+        self._by_id: Dict[Any, Dict[str, Any]] = {}
+        # Visits in the table without any filter applied (for the status bar)
+        self.total_visitas = 0
+        self._search_timer = None
+        # (estado, search words) that visitas_data was loaded for; rows for a
+        # narrower filter are a subset of it
+        self._loaded_filter: Tuple[str, Tuple[str, ...]] = ("todas", ())
+        # Visits matching _loaded_filter; visitas_data holds the first pages
+        self.matched_visitas = 0
+        # id_visita -> (row key, cells) of what the DataTable is showing
+        self._rendered_rows: Dict[Any, Tuple[RowKey, Tuple[Any, ...]]] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the visitas screen UI"""
@@ -139,8 +229,8 @@ class VisitasScreen(Screen):
             else:
                 user_display = self.username
                 rol_display = ""
-            stats_text = f"👤 {user_display}{rol_display} | Nodo {self.bully_manager.node_id} | {self.bully_manager.state.value.upper()}"
-            yield Label(stats_text, id="header-stats")
+            self._stats_text = f"👤 {user_display}{rol_display} | Nodo {self.bully_manager.node_id} | {self.bully_manager.state.value.upper()}"
+            yield Label(self._stats_text, id="header-stats")
 
         # Toolbar with search, filter, and new visit button
         with Horizontal(id="toolbar"):
@@ -174,33 +264,57 @@ class VisitasScreen(Screen):
         """Initialize the screen when mounted"""
         # Setup DataTable columns
         table = self.query_one("#visitas-table", DataTable)
-        table.add_columns(
-            "Folio",
-            "Paciente",
-            "Doctor",
-            "Sala",
-            "Cama",
-            "Estado",
-            "Fecha/Hora"
-        )
+        for label, key in _COLUMNS:
+            table.add_column(label, key=key)
 
         # Load initial data
         self.load_visitas()
 
+    @property
+    def all_loaded(self) -> bool:
+        """True when every visit matching the loaded filters is in visitas_data"""
+        return len(self.visitas_data) >= self.matched_visitas
+
     @work(exclusive=True)
-    async def load_visitas(self) -> None:
-        """Load visits from database asynchronously"""
+    async def load_visitas(self, more: bool = False) -> None:
+        """
+        Load visits from database asynchronously, one page at a time
+
+        more=True appends the next page to the rows already loaded
+        """
         self.is_loading = True
         self.update_status("⏳ Cargando visitas...")
 
+        # Snapshot the filters this load answers for
+        estado = self.filter_estado
+        tokens = _search_tokens(self.search_query)
+        offset = len(self.visitas_data) if more else 0
+
         try:
-            # Run DB query in thread pool to avoid blocking UI
-            visitas = await asyncio.to_thread(self._fetch_visitas_from_db)
+            # Run DB queries on the shared DB executor to avoid blocking UI; its
+            # workers keep their app context and pooled connection between
+            # loads. The page and the per-estado counts run side by side
+            (visitas, matched), counts = await asyncio.gather(
+                run_db(self._fetch_visitas_from_db, estado, tokens, offset),
+                run_db(self._fetch_estado_counts),
+            )
+
+            if more:
+                # OFFSET can repeat a row if visits were added in between
+                loaded = {v['id_visita'] for v in self.visitas_data}
+                visitas = self.visitas_data + [v for v in visitas if v['id_visita'] not in loaded]
 
             # Update reactive state (triggers watch_visitas_data)
+            self.total_visitas = sum(counts.values())
+            self.matched_visitas = matched
+            self.update_header_counts(counts)
+            self._loaded_filter = (estado, tokens)
             self.visitas_data = visitas
 
-            self.update_status(f"✓ {len(visitas)} visitas cargadas")
+            if self.all_loaded:
+                self.update_status(f"✓ {len(visitas)} visitas cargadas")
+            else:
+                self.update_status(f"✓ {len(visitas)} de {matched} visitas cargadas | Ctrl+L: cargar más")
 
         except Exception as e:
             self.update_status(f"❌ Error: {str(e)}")
@@ -208,18 +322,106 @@ class VisitasScreen(Screen):
         finally:
             self.is_loading = False
 
-    def _fetch_visitas_from_db(self) -> List[Dict[str, Any]]:
-        """Fetch visits from database (runs in thread pool)"""
-        with self.flask_app.app_context():
-            from models import VisitaEmergencia
+    def _fetch_visitas_from_db(
+        self, estado: str, tokens: Tuple[str, ...], offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch one page of the visits matching the filters (runs on the DB executor)
+
+        Returns (visitas, matched): matched counts every visit matching the filters
+        """
+        from models import db, VisitaEmergencia, Paciente, Doctor, Cama, Sala
+
+        # Plain rows with the same keys as VisitaEmergencia.to_dict(): no
+        # ORM objects, and the names come from the joins instead of four
+        # lazy loads per visit
+        stmt = (
+            select(
+                VisitaEmergencia.id_visita,
+                VisitaEmergencia.folio,
+                Paciente.nombre.label('paciente'),
+                Doctor.nombre.label('doctor'),
+                Cama.numero.label('cama'),
+                Sala.numero.label('sala'),
+                VisitaEmergencia.sintomas,
+                VisitaEmergencia.estado,
+                VisitaEmergencia.timestamp,
+                VisitaEmergencia.fecha_cierre,
+            )
+            .join(Paciente, Paciente.id_paciente == VisitaEmergencia.id_paciente)
+            .join(Doctor, Doctor.id_doctor == VisitaEmergencia.id_doctor)
+            .join(Cama, Cama.id_cama == VisitaEmergencia.id_cama)
+            .join(Sala, Sala.id_sala == VisitaEmergencia.id_sala)
+        )
+
+        count = select(func.count()).select_from(VisitaEmergencia)
+
+        if estado != "todas":
+            stmt = stmt.where(VisitaEmergencia.estado == estado)
+            count = count.where(VisitaEmergencia.estado == estado)
+
+        if tokens:
+            # Every word must appear in folio, patient or doctor. Bound
+            # parameters, so the statement text (and SQLite's compiled
+            # plan) only depends on the number of words. The tokens are
+            # already lowercase; on SQLite the columns go through
+            # unicode_lower (registered by create_app) so accented capitals
+            # fold like they do in the local filter
+            lower = func.unicode_lower if db.engine.dialect.name == 'sqlite' else func.lower
+            matches = and_(*(
+                or_(
+                    lower(VisitaEmergencia.folio).like(pattern, escape="\\"),
+                    lower(Paciente.nombre).like(pattern, escape="\\"),
+                    lower(Doctor.nombre).like(pattern, escape="\\"),
+                )
+                for pattern in map(_like_pattern, tokens)
+            ))
+            stmt = stmt.where(matches)
+            count = count.join(
+                Paciente, Paciente.id_paciente == VisitaEmergencia.id_paciente
+            ).join(
+                Doctor, Doctor.id_doctor == VisitaEmergencia.id_doctor
+            ).where(matches)
+
+        # Ordered by timestamp desc (served by ix_visitas_estado_ts);
+        # id_visita breaks ties so pages don't overlap
+        rows = [
+            dict(row)
+            for row in db.session.execute(
+                stmt.order_by(VisitaEmergencia.timestamp.desc(), VisitaEmergencia.id_visita.desc())
+                .limit(_PAGE_SIZE)
+                .offset(offset)
+            ).mappings()
+        ]
+        # Dates as ISO strings (like to_dict()), the display timestamp
+        # formatted once here instead of on every redraw of the table, plus
+        # one lowercase blob of the searchable fields for local narrowing
+        # ("\n" can't be typed in the search box, so no cross-field hits)
+        for row in rows:
+            for field in ('timestamp', 'fecha_cierre'):
+                if row[field] is not None:
+                    row[field] = row[field].isoformat()
+            row['_ts_display'] = _fmt_ts(row['timestamp']) if row.get('timestamp') else ""
+            row['_search_blob'] = "\n".join(
+                str(row.get(field) or '') for field in ('folio', 'paciente', 'doctor')
+            ).lower()
+
+        # A first page that isn't full already is the whole result
+        if offset == 0 and len(rows) < _PAGE_SIZE:
+            matched = len(rows)
+        else:
+            matched = db.session.execute(count).scalar_one()
+
+        return rows, matched
 
-            # Query all visits ordered by timestamp desc
-            visitas = VisitaEmergencia.query.order_by(
-                VisitaEmergencia.timestamp.desc()
-            ).all()
+    @staticmethod
+    def _fetch_estado_counts() -> Dict[str, int]:
+        """Visits per estado, whatever the filters (runs on the DB executor)"""
+        from models import db, VisitaEmergencia
 
-            # Convert to dict format
-            return [v.to_dict() for v in visitas]
+        return dict(db.session.execute(
+            select(VisitaEmergencia.estado, func.count()).group_by(VisitaEmergencia.estado)
+        ).all())
 
     def watch_visitas_data(self, visitas: List[Dict[str, Any]]) -> None:
         """React to changes in visitas data"""
@@ -227,83 +429,123 @@ class VisitasScreen(Screen):
 
     def watch_search_query(self, query: str) -> None:
         """React to search query changes"""
-        self.apply_filters()
+        self._filters_changed()
 
     def watch_filter_estado(self, estado: str) -> None:
         """React to filter changes"""
-        self.apply_filters()
+        self._filters_changed()
+
+    def _filters_changed(self) -> None:
+        """Narrow the loaded rows locally when possible, otherwise reload"""
+        loaded_estado, loaded_tokens = self._loaded_filter
+        tokens = _search_tokens(self.search_query)
+        # Narrower if each loaded word is part of some new word
+        narrower = self.all_loaded and (
+            loaded_estado in ("todas", self.filter_estado)
+            and all(any(old in new for new in tokens) for old in loaded_tokens)
+        )
+        if narrower:
+            # Every match of the new filters is already in visitas_data
+            self.apply_filters()
+        else:
+            # exclusive worker: a load still running for the old filters is cancelled
+            self.load_visitas()
 
     def apply_filters(self) -> None:
-        """Apply search and filter to visitas data"""
-        # Start with all visitas
-        filtered = self.visitas_data.copy()
-
-        # Apply estado filter
-        if self.filter_estado != "todas":
-            filtered = [v for v in filtered if v.get('estado') == self.filter_estado]
-
-        # Apply search query
-        query = self.search_query.lower().strip()
-        if query:
+        """Apply search and filter to the loaded visitas"""
+        tokens = _search_tokens(self.search_query)
+        if self._loaded_filter == (self.filter_estado, tokens):
+            # Loaded for exactly these filters
+            filtered = self.visitas_data
+        else:
+            # One pass over the loaded visitas, estado and words tested together
+            estado = self.filter_estado
+            matches = _search_matcher(tokens) if tokens else None
             filtered = [
-                v for v in filtered
-                if (
-                    query in str(v.get('folio', '')).lower() or
-                    query in str(v.get('paciente', '')).lower() or
-                    query in str(v.get('doctor', '')).lower()
-                )
+                v for v in self.visitas_data
+                if (estado == "todas" or v.get('estado') == estado)
+                and (matches is None or matches(v['_search_blob']))
             ]
 
         self.filtered_visitas = filtered
+        # Row key (id_visita) -> visita, for the row-selected handler
+        self._by_id = {v.get('id_visita'): v for v in filtered}
         self.update_table()
 
+    @staticmethod
+    def _row_cells(visita: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Cell values for one visita, in _COLUMNS order"""
+        # Estado with color (shared Text for the known ones)
+        estado = visita.get('estado', 'desconocido')
+        estado_text = _ESTADO_TEXT.get(estado) or Text(estado.upper())
+
+        return (
+            visita.get('folio', ''),
+            visita.get('paciente', ''),
+            visita.get('doctor', ''),
+            str(visita.get('sala', '')),
+            str(visita.get('cama', '')),
+            estado_text,
+            visita['_ts_display'],
+        )
+
     def update_table(self) -> None:
-        """Update DataTable with filtered visitas"""
+        """
+        Update DataTable with filtered visitas
+
+        Only the difference with what is already on screen is applied: rows
+        that left the result are removed, new ones added, and changed cells
+        updated in place.
+        """
         table = self.query_one("#visitas-table", DataTable)
-        table.clear()
-
-        for visita in self.filtered_visitas:
-            # Format timestamp
-            timestamp_str = ""
-            if visita.get('timestamp'):
-                try:
-                    dt = datetime.fromisoformat(visita['timestamp'].replace('Z', '+00:00'))
-                    timestamp_str = dt.strftime('%d/%m %H:%M')
-                except:
-                    timestamp_str = visita['timestamp'][:16]
-
-            # Create estado with color
-            estado = visita.get('estado', 'desconocido')
-            estado_text = Text(estado.upper())
-
-            if estado == 'activa':
-                estado_text.stylize("bold green")
-            elif estado == 'completada':
-                estado_text.stylize("dim")
-            elif estado == 'cancelada':
-                estado_text.stylize("bold red")
-
-            # Add row to table
-            table.add_row(
-                visita.get('folio', ''),
-                visita.get('paciente', ''),
-                visita.get('doctor', ''),
-                str(visita.get('sala', '')),
-                str(visita.get('cama', '')),
-                estado_text,
-                timestamp_str,
-                key=visita.get('id_visita', '')
-            )
+
+        rows = {visita.get('id_visita'): self._row_cells(visita) for visita in self.filtered_visitas}
+        rendered = self._rendered_rows
+
+        for id_visita in rendered.keys() - rows.keys():
+            table.remove_row(rendered.pop(id_visita)[0])
+
+        for id_visita, cells in rows.items():
+            previous = rendered.get(id_visita)
+            if previous is None:
+                row_key = table.add_row(*cells, key=id_visita)
+            else:
+                row_key, old_cells = previous
+                for column, old, new in zip(_COLUMN_KEYS, old_cells, cells):
+                    if old != new:
+                        table.update_cell(row_key, column, new)
+            rendered[id_visita] = (row_key, cells)
+
+        # New rows went to the bottom; restore the query's order if needed
+        # (folio is unique, so it identifies the row inside the sort key)
+        if list(rendered) != list(rows):
+            position = {cells[0]: i for i, cells in enumerate(rows.values())}
+            if len(position) == len(rows):
+                table.sort("folio", key=position.__getitem__)
+            else:
+                table.clear()
+                for id_visita, cells in rows.items():
+                    rendered[id_visita] = (table.add_row(*cells, key=id_visita), cells)
+            self._rendered_rows = {id_visita: rendered[id_visita] for id_visita in rows}
 
         # Update status bar
-        total = len(self.visitas_data)
+        total = self.total_visitas
         showing = len(self.filtered_visitas)
 
-        if total == showing:
+        if not self.all_loaded:
+            self.update_status(f"📊 Mostrando {showing} de {self.matched_visitas} visitas | Ctrl+L: cargar más")
+        elif total == showing:
             self.update_status(f"📊 Mostrando {total} visitas")
         else:
             self.update_status(f"📊 Mostrando {showing} de {total} visitas")
 
+    def update_header_counts(self, counts: Dict[str, int]) -> None:
+        """Add the per-estado visit counts to the header stats"""
+        resumen = " · ".join(
+            f"{counts.get(estado, 0)} {etiqueta}" for estado, etiqueta in _ESTADO_RESUMEN
+        )
+        self.query_one("#header-stats", Label).update(f"{self._stats_text} | {resumen}")
+
     def update_status(self, message: str) -> None:
         """Update status bar message"""
         status_bar = self.query_one("#status-bar", Static)
@@ -312,7 +554,13 @@ class VisitasScreen(Screen):
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes"""
         if event.input.id == "search-input":
-            self.search_query = event.value
+            # Debounced: a burst of keystrokes runs a single search
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            value = event.value
+            self._search_timer = self.set_timer(
+                _SEARCH_DEBOUNCE, lambda: setattr(self, "search_query", value)
+            )
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle filter select changes"""
@@ -329,10 +577,7 @@ class VisitasScreen(Screen):
         if event.row_key:
             # Find the visita by id
             visita_id = event.row_key.value
-            visita = next(
-                (v for v in self.filtered_visitas if v.get('id_visita') == visita_id),
-                None
-            )
+            visita = self._by_id.get(visita_id)
 
             if visita:
                 # Import here to avoid circular dependency
@@ -345,6 +590,17 @@ class VisitasScreen(Screen):
                     )
                 )
 
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Reaching the last row loads the next page"""
+        if event.cursor_row >= event.data_table.row_count - 1:
+            self.action_load_more()
+
+    def action_load_more(self) -> None:
+        """Append the next page of visitas"""
+        # A running load is for newer filters; don't cancel it
+        if not self.all_loaded and not self.is_loading:
+            self.load_visitas(more=True)
+
     def action_refresh(self) -> None:
         """Refresh visitas data"""
         self.notify("🔄 Actualizando visitas...", severity="information")
@@ -5,5 +5,6 @@ Utilities - Validators, formatters, and helpers
 # Utilities will be imported here
 # from .validators import validate_curp, validate_phone
 # from .formatters import format_datetime, format_currency
+from .db_executor import init_db_executor, get_db_executor, run_db, shutdown_db_executor
 
-__all__ = []
+__all__ = ['init_db_executor', 'get_db_executor', 'run_db', 'shutdown_db_executor']
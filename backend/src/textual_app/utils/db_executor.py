@@ -0,0 +1,68 @@
+"""
+DB executor - Shared thread pool for blocking database work
+
+Each worker thread pushes a Flask app context once, when it starts, so
+screens don't pay for ``flask_app.app_context()`` on every query.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _push_app_context(flask_app) -> None:
+    """Worker initializer: keep one app context pushed for the thread's lifetime"""
+    flask_app.app_context().push()
+
+
+def _run_with_session_cleanup(fn: Callable[..., T], *args: Any) -> T:
+    """Run fn and release the scoped session so the identity map doesn't go stale"""
+    from models import db
+
+    try:
+        return fn(*args)
+    finally:
+        db.session.remove()
+
+
+def init_db_executor(flask_app, max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    Create the shared executor (idempotent). Defaults to the app's DB_WORKERS
+    setting, which also sizes the engine pool, so each worker has a connection.
+    """
+    global _executor
+    if _executor is None:
+        if max_workers is None:
+            max_workers = flask_app.config.get('DB_WORKERS', 4)
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="db",
+            initializer=_push_app_context,
+            initargs=(flask_app,),
+        )
+    return _executor
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Return the shared executor, failing loudly if the app didn't create it"""
+    if _executor is None:
+        raise RuntimeError("DB executor not initialized - call init_db_executor() first")
+    return _executor
+
+
+async def run_db(fn: Callable[..., T], *args: Any) -> T:
+    """Await fn(*args) on the DB executor, inside the worker's app context"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), _run_with_session_cleanup, fn, *args)
+
+
+def shutdown_db_executor() -> None:
+    """Stop the executor without waiting for queued work"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
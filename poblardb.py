@@ -5,6 +5,15 @@ from datetime import datetime
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, 'emergencias.db')
 
+# Sentencias de carga. El caché de sentencias preparadas de sqlite3 usa el
+# texto exacto como llave, así que cada tabla siempre usa la misma cadena
+SQL_INS_PACIENTE = "INSERT INTO PACIENTES (nombre, edad, sexo, contacto) VALUES (?, ?, ?, ?)"
+SQL_INS_DOCTOR = "INSERT INTO DOCTORES (nombre, sala_id, disponible) VALUES (?, ?, ?)"
+SQL_INS_TRABAJADOR_SOCIAL = "INSERT INTO TRABAJADORES_SOCIALES (nombre, sala_id, activo) VALUES (?, ?, ?)"
+SQL_INS_CAMA = "INSERT INTO CAMAS_ATENCION (numero, sala_id, ocupada) VALUES (?, ?, ?)"
+SQL_INS_USUARIO = "INSERT INTO USUARIOS_SISTEMA (username, password, rol, id_personal) VALUES (?, ?, ?, ?)"
+SQL_INS_CONSECUTIVO = "INSERT OR REPLACE INTO CONSECUTIVOS_VISITAS (sala_id, ultimo_consecutivo) VALUES (?, ?)"
+
 def poblar_datos_reales():
     """
     Función principal para poblar la base de datos con datos de prueba.
@@ -12,9 +21,14 @@ def poblar_datos_reales():
     """
     conn = None
     try:
-        conn = sqlite3.connect(DB_PATH)
+        # Transacciones explícitas: sqlite3 no abre ni confirma ninguna por su cuenta
+        conn = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
         cursor = conn.cursor()
         cursor.execute("PRAGMA foreign_keys = ON;")
+        # Script de carga desechable: sin fsync por commit, temporales en memoria
+        cursor.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY;"
+        )
 
         print("🧹 Limpiando y recreando base de datos...")
         
@@ -28,23 +42,26 @@ def poblar_datos_reales():
             "USUARIOS_SISTEMA",
             "CONSECUTIVOS_VISITAS"
         ]
-        
-        for tabla in tablas:
-            try:
-                cursor.execute(f"DROP TABLE IF EXISTS {tabla}")
-                print(f"   - Tabla {tabla} eliminada")
-            except Exception as e:
-                print(f"   - Error eliminando {tabla}: {e}")
-        
+
         # RECREAR todas las tablas desde schema2.sql
         schema_path = os.path.join(BASE_DIR, 'schema2.sql')
-        if os.path.exists(schema_path):
-            with open(schema_path, 'r') as f:
-                sql_script = f.read()
-            cursor.executescript(sql_script)
-            print("✅ Tablas recreadas desde schema2.sql")
-        else:
+        if not os.path.exists(schema_path):
             print("❌ schema2.sql no encontrado")
+            return
+        with open(schema_path, 'r') as f:
+            sql_script = f.read()
+
+        # DROPs y esquema en un solo script. executescript() confirma cualquier
+        # transacción pendiente antes de correr, así que el BEGIN va dentro del
+        # script: la transacción sigue abierta para los datos de prueba
+        drops = "".join(f"DROP TABLE IF EXISTS {tabla};\n" for tabla in tablas)
+        try:
+            cursor.executescript("BEGIN;\n" + drops + sql_script)
+        except sqlite3.Error as e:
+            print(f"   - Error recreando tablas: {e}")
+            raise
+        print(f"   - {len(tablas)} tablas eliminadas")
+        print("✅ Tablas recreadas desde schema2.sql")
 
         print("📦 Insertando datos de prueba...")
 
@@ -54,10 +71,7 @@ def poblar_datos_reales():
             ('Carlos Rodríguez', 45, 'M', '555-0102'),
             ('María Fernández', 32, 'F', '555-0103')
         ]
-        cursor.executemany(
-            "INSERT INTO PACIENTES (nombre, edad, sexo, contacto) VALUES (?, ?, ?, ?)", 
-            pacientes
-        )
+        cursor.executemany(SQL_INS_PACIENTE, pacientes)
 
         # Plantilla médica inicial
         doctores = [
@@ -65,23 +79,14 @@ def poblar_datos_reales():
             ('Dra. Elena Vázquez', 1, 1),
             ('Dr. Samuel Kim', 1, 1)
         ]
-        cursor.executemany(
-            "INSERT INTO DOCTORES (nombre, sala_id, disponible) VALUES (?, ?, ?)", 
-            doctores
-        )
+        cursor.executemany(SQL_INS_DOCTOR, doctores)
 
         # Personal de trabajo social
-        cursor.execute(
-            "INSERT INTO TRABAJADORES_SOCIALES (nombre, sala_id, activo) VALUES (?, ?, ?)",
-            ('Lic. Roberto Gómez', 1, 1)
-        )
+        cursor.execute(SQL_INS_TRABAJADOR_SOCIAL, ('Lic. Roberto Gómez', 1, 1))
 
         # Configuración de camas disponibles (SIN restricciones UNIQUE)
-        for i in range(101, 106):
-            cursor.execute(
-                "INSERT INTO CAMAS_ATENCION (numero, sala_id, ocupada) VALUES (?, ?, ?)",
-                (i, 1, 0)
-            )
+        camas = [(i, 1, 0) for i in range(101, 106)]
+        cursor.executemany(SQL_INS_CAMA, camas)
 
         # Usuarios del sistema para acceso
         usuarios = [
@@ -90,18 +95,12 @@ def poblar_datos_reales():
             ('doctor2', 'doctor2', 'DOCTOR', 2),
             ('doctor3', 'doctor3', 'DOCTOR', 3)
         ]
-        cursor.executemany(
-            "INSERT INTO USUARIOS_SISTEMA (username, password, rol, id_personal) VALUES (?, ?, ?, ?)", 
-            usuarios
-        )
+        cursor.executemany(SQL_INS_USUARIO, usuarios)
 
         # Inicialización del sistema de consecutivos
-        cursor.execute(
-            "INSERT OR REPLACE INTO CONSECUTIVOS_VISITAS (sala_id, ultimo_consecutivo) VALUES (?, ?)",
-            (1, 0)
-        )
+        cursor.execute(SQL_INS_CONSECUTIVO, (1, 0))
 
-        conn.commit()
+        cursor.execute("COMMIT")
         
         print("\n✅ Base de datos poblada exitosamente!")
         print("\n🔧 Cambios aplicados:")
@@ -116,7 +115,7 @@ def poblar_datos_reales():
 
     except Exception as e:
         print(f"❌ Error durante la población de la base de datos: {e}")
-        if conn:
+        if conn and conn.in_transaction:
             conn.rollback()
     finally:
         if conn: